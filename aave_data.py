@@ -43,7 +43,7 @@ MULTICALL3_ABI = [
     {"inputs": [{"components": [{"name": "target", "type": "address"}, {"name": "callData", "type": "bytes"}], "name": "calls", "type": "tuple[]"}], "name": "aggregate", "outputs": [{"name": "blockNumber", "type": "uint256"}, {"name": "returnData", "type": "bytes[]"}], "stateMutability": "payable", "type": "function"}
 ]
 
-def get_holders_blockscout(token_address, blockscout_url, max_holders=200):
+def get_holders_blockscout(token_address, blockscout_url, max_holders=200, emit=print):
     """Fetch token holders from Blockscout"""
     holders = []
     url = f"{blockscout_url}/api/v2/tokens/{token_address}/holders"
@@ -61,7 +61,7 @@ def get_holders_blockscout(token_address, blockscout_url, max_holders=200):
             url = f"{blockscout_url}/api/v2/tokens/{token_address}/holders?" + requests.compat.urlencode(next_params) if next_params else None
             time.sleep(0.3)
         except Exception as e:
-            print(f"  ⚠️  Blockscout error: {e}")
+            emit(f"  ⚠️  Blockscout error: {e}")
             break
     
     return holders[:max_holders]
@@ -72,11 +72,14 @@ def decode_ltv_liquidation(config_data):
     liquidation_threshold = ((config_data >> 16) & 0xFFFF) / 100  # Next 16 bits
     return ltv, liquidation_threshold
 
-def analyze_aave_market(token_address, chain_name, chain_config):
-    """Complete AAVE market analysis for any token. Returns dict with all metrics."""
-    print(f"\n{'='*70}")
-    print(f"🔍 Analyzing {chain_name} - AAVE V3")
-    print(f"{'='*70}\n")
+def analyze_aave_market(token_address, chain_name, chain_config, emit=print):
+    """Complete AAVE market analysis for any token. Returns dict with all metrics.
+
+    Progress and the report are written through emit (print by default).
+    """
+    emit(f"\n{'='*70}")
+    emit(f"🔍 Analyzing {chain_name} - AAVE V3")
+    emit(f"{'='*70}\n")
 
     result = {
         "chain": chain_name,
@@ -95,7 +98,7 @@ def analyze_aave_market(token_address, chain_name, chain_config):
         pool = w3.eth.contract(address=chain_config['pool'], abi=POOL_ABI)
 
         # Get reserve data
-        print("📊 Fetching reserve data...")
+        emit("📊 Fetching reserve data...")
         reserve_data = pool.functions.getReserveData(token_address).call()
         config = pool.functions.getConfiguration(token_address).call()
 
@@ -112,7 +115,7 @@ def analyze_aave_market(token_address, chain_name, chain_config):
         symbol = underlying_token.functions.symbol().call()
         decimals_divisor = 10 ** decimals
 
-        print(f"  Token: {symbol} ({decimals} decimals)")
+        emit(f"  Token: {symbol} ({decimals} decimals)")
 
         # Basic metrics
         total_supply = atoken.functions.totalSupply().call() / decimals_divisor
@@ -139,22 +142,22 @@ def analyze_aave_market(token_address, chain_name, chain_config):
         }
 
         # Display basic metrics
-        print(f"\n📈 Market Overview:")
-        print(f"  Total Supply:          {total_supply:,.4f} {symbol}")
-        print(f"  Total Borrow:          {total_borrow:,.4f} {symbol}")
-        print(f"  Supply APY:            {supply_apy:.2f}%")
-        print(f"  Borrow APY:            {borrow_apy:.2f}%")
-        print(f"  LTV:                   {ltv:.0f}%")
-        print(f"  Liquidation Threshold: {liquidation_threshold:.0f}%")
-        print(f"  Utilization Rate:      {utilization:.2f}%")
+        emit(f"\n📈 Market Overview:")
+        emit(f"  Total Supply:          {total_supply:,.4f} {symbol}")
+        emit(f"  Total Borrow:          {total_borrow:,.4f} {symbol}")
+        emit(f"  Supply APY:            {supply_apy:.2f}%")
+        emit(f"  Borrow APY:            {borrow_apy:.2f}%")
+        emit(f"  LTV:                   {ltv:.0f}%")
+        emit(f"  Liquidation Threshold: {liquidation_threshold:.0f}%")
+        emit(f"  Utilization Rate:      {utilization:.2f}%")
 
         # RLR Calculation
-        print(f"\n🔄 Calculating RLR (Recursive Lending Ratio)...")
-        suppliers = get_holders_blockscout(atoken_address, chain_config['blockscout'])
-        borrowers = get_holders_blockscout(debt_token_address, chain_config['blockscout'])
+        emit(f"\n🔄 Calculating RLR (Recursive Lending Ratio)...")
+        suppliers = get_holders_blockscout(atoken_address, chain_config['blockscout'], emit=emit)
+        borrowers = get_holders_blockscout(debt_token_address, chain_config['blockscout'], emit=emit)
 
         if not suppliers or not borrowers:
-            print("  ⚠️  Insufficient holder data for RLR")
+            emit("  ⚠️  Insufficient holder data for RLR")
             result["rlr"] = {"error": "Insufficient holder data"}
             result["clr"] = {"error": "Insufficient holder data"}
             result["status"] = "partial"
@@ -219,23 +222,23 @@ def analyze_aave_market(token_address, chain_name, chain_config):
             "top_loopers": looper_details[:10]
         }
 
-        print(f"  Loopers Detected:      {len(looper_details)} addresses")
-        print(f"  Looped Borrow:         {looped_borrow:,.4f} {symbol}")
-        print(f"  RLR (Supply-based):    {rlr_supply:.2f}%")
-        print(f"  RLR (Borrow-based):    {rlr_borrow:.2f}%")
+        emit(f"  Loopers Detected:      {len(looper_details)} addresses")
+        emit(f"  Looped Borrow:         {looped_borrow:,.4f} {symbol}")
+        emit(f"  RLR (Supply-based):    {rlr_supply:.2f}%")
+        emit(f"  RLR (Borrow-based):    {rlr_borrow:.2f}%")
 
-        print(f"\n  📊 Looper Leverage Statistics:")
-        print(f"  Average Leverage:      {leverage_avg:.2f}x")
-        print(f"  Max Leverage:          {leverage_max:.2f}x")
-        print(f"  Min Leverage:          {leverage_min:.2f}x")
+        emit(f"\n  📊 Looper Leverage Statistics:")
+        emit(f"  Average Leverage:      {leverage_avg:.2f}x")
+        emit(f"  Max Leverage:          {leverage_max:.2f}x")
+        emit(f"  Min Leverage:          {leverage_min:.2f}x")
 
-        print(f"\n  🔝 Top 10 Loopers by Leverage:")
+        emit(f"\n  🔝 Top 10 Loopers by Leverage:")
         for i, looper in enumerate(looper_details[:10], 1):
-            print(f"    {i}. {looper['address'][:10]}...{looper['address'][-8:]}")
-            print(f"       Supply: {looper['supply']:,.4f} {symbol} | Borrow: {looper['borrow']:,.4f} {symbol} | Leverage: {looper['leverage']:.2f}x")
+            emit(f"    {i}. {looper['address'][:10]}...{looper['address'][-8:]}")
+            emit(f"       Supply: {looper['supply']:,.4f} {symbol} | Borrow: {looper['borrow']:,.4f} {symbol} | Leverage: {looper['leverage']:.2f}x")
 
         # CLR Calculation
-        print(f"\n⚠️  Calculating CLR (Cascade Liquidation Risk)...")
+        emit(f"\n⚠️  Calculating CLR (Cascade Liquidation Risk)...")
 
         borrower_list = [addr for addr, _ in borrowers[:100]]  # Limit to 100 for speed
 
@@ -247,7 +250,7 @@ def analyze_aave_market(token_address, chain_name, chain_config):
             call_data = pool.encode_abi('getUserAccountData', [borrower])
             calls.append((pool.address, call_data))
 
-        print(f"  Fetching health factors for {len(borrower_list)} borrowers...")
+        emit(f"  Fetching health factors for {len(borrower_list)} borrowers...")
         _, results = multicall.functions.aggregate(calls).call()
 
         # Decode results
@@ -309,7 +312,7 @@ def analyze_aave_market(token_address, chain_name, chain_config):
             }
         }
 
-        print(f"\n  Health Factor Distribution:")
+        emit(f"\n  Health Factor Distribution:")
         bucket_labels = {
             "critical": "Critical (HF < 1.0)",
             "high_risk": "High Risk (1.0 ≤ HF < 1.05)",
@@ -320,18 +323,18 @@ def analyze_aave_market(token_address, chain_name, chain_config):
         for bucket_key, positions in risk_buckets.items():
             count = len(positions)
             pct = (count / total_positions * 100) if total_positions > 0 else 0
-            print(f"    {bucket_labels[bucket_key]}: {count} positions ({pct:.1f}%)")
+            emit(f"    {bucket_labels[bucket_key]}: {count} positions ({pct:.1f}%)")
 
-        print(f"\n  CLR (by count):        {clr_count:.2f}%")
-        print(f"  CLR (by value):        {clr_value:.2f}%")
-        print(f"  Positions Analyzed:    {total_positions}")
-        print(f"  Debt Analyzed:         ${total_debt_analyzed:,.2f}")
+        emit(f"\n  CLR (by count):        {clr_count:.2f}%")
+        emit(f"  CLR (by value):        {clr_value:.2f}%")
+        emit(f"  Positions Analyzed:    {total_positions}")
+        emit(f"  Debt Analyzed:         ${total_debt_analyzed:,.2f}")
 
         result["status"] = "success"
         return result
 
     except Exception as e:
-        print(f"❌ Error analyzing {chain_name}: {e}")
+        emit(f"❌ Error analyzing {chain_name}: {e}")
         result["error"] = str(e)
         return result
 
@@ -62,7 +62,7 @@ MULTICALL3_ABI = [
     {"inputs": [{"components": [{"name": "target", "type": "address"}, {"name": "callData", "type": "bytes"}], "name": "calls", "type": "tuple[]"}], "name": "aggregate", "outputs": [{"name": "blockNumber", "type": "uint256"}, {"name": "returnData", "type": "bytes[]"}], "stateMutability": "payable", "type": "function"}
 ]
 
-def fetch_positions_from_subgraph(subgraph_url, comet_address, limit=100):
+def fetch_positions_from_subgraph(subgraph_url, comet_address, limit=100, emit=print):
     """Fetch positions (borrowers) from The Graph - Compound V3 schema"""
     query = """
     query GetTopBorrowers($market: String!, $first: Int!) {
@@ -103,19 +103,19 @@ def fetch_positions_from_subgraph(subgraph_url, comet_address, limit=100):
         )
         
         if response.status_code != 200:
-            print(f"    ⚠️  HTTP {response.status_code}: {response.text[:200]}")
+            emit(f"    ⚠️  HTTP {response.status_code}: {response.text[:200]}")
             return []
         
         data = response.json()
         
         if 'errors' in data:
-            print(f"    ⚠️  GraphQL errors: {data['errors']}")
+            emit(f"    ⚠️  GraphQL errors: {data['errors']}")
             return []
         
         positions = data.get('data', {}).get('positions', [])
         
         if not positions:
-            print(f"    ℹ️  No positions found in subgraph")
+            emit(f"    ℹ️  No positions found in subgraph")
             return []
         
         # Extract borrower addresses and convert to checksum format
@@ -125,20 +125,23 @@ def fetch_positions_from_subgraph(subgraph_url, comet_address, limit=100):
             if pos.get('accounting', {}).get('baseBalanceUsd') is not None
         ]
         
-        print(f"    ✓ Found {len(borrowers)} borrowers in subgraph")
+        emit(f"    ✓ Found {len(borrowers)} borrowers in subgraph")
         return borrowers
         
     except Exception as e:
-        print(f"    ⚠️  Error: {e}")
+        emit(f"    ⚠️  Error: {e}")
         return []
 
 
 
-def analyze_compound_market(collateral_address, chain_name, chain_config):
-    """Analyze Compound v3 market for a specific collateral. Returns dict with all metrics."""
-    print(f"\n{'='*70}")
-    print(f"🔍 Analyzing {chain_name} - Compound v3")
-    print(f"{'='*70}\n")
+def analyze_compound_market(collateral_address, chain_name, chain_config, emit=print):
+    """Analyze Compound v3 market for a specific collateral. Returns dict with all metrics.
+
+    Progress and the report are written through emit (print by default).
+    """
+    emit(f"\n{'='*70}")
+    emit(f"🔍 Analyzing {chain_name} - Compound v3")
+    emit(f"{'='*70}\n")
 
     result = {
         "chain": chain_name,
@@ -163,11 +166,11 @@ def analyze_compound_market(collateral_address, chain_name, chain_config):
         result["collateral_symbol"] = collateral_symbol
         result["collateral_decimals"] = collateral_decimals
 
-        print(f"📊 Collateral: {collateral_symbol}")
+        emit(f"📊 Collateral: {collateral_symbol}")
 
         # Check each market
         for market_name, comet_address in chain_config['markets'].items():
-            print(f"\n--- {market_name} Market ---")
+            emit(f"\n--- {market_name} Market ---")
 
             market_result = {
                 "market_name": market_name,
@@ -182,7 +185,7 @@ def analyze_compound_market(collateral_address, chain_name, chain_config):
                 asset_info = comet.functions.getAssetInfoByAddress(collateral_address).call()
                 market_result["supported"] = True
             except:
-                print(f"  ⚠️  {collateral_symbol} not supported in {market_name} market")
+                emit(f"  ⚠️  {collateral_symbol} not supported in {market_name} market")
                 result["markets"].append(market_result)
                 continue
 
@@ -239,45 +242,46 @@ def analyze_compound_market(collateral_address, chain_name, chain_config):
                 "liquidation_cf": liquidate_cf
             }
 
-            print(f"\n  📈 Market Overview:")
-            print(f"    Base Asset:            {base_symbol}")
-            print(f"    Total Supply:          {total_supply:,.2f} {base_symbol}")
-            print(f"    Total Borrow:          {total_borrow:,.2f} {base_symbol}")
-            print(f"    Supply APY:            {supply_rate:.2f}%")
-            print(f"    Borrow APY:            {borrow_rate:.2f}%")
-            print(f"    Utilization:           {utilization:.2f}%")
-
-            print(f"\n  💰 {collateral_symbol} Collateral:")
-            print(f"    Total Supplied:        {total_collateral_supplied:,.4f} {collateral_symbol}")
-            print(f"    Supply Cap:            {supply_cap:,.4f} {collateral_symbol}")
-            print(f"    Cap Utilization:       {(total_collateral_supplied/supply_cap*100) if supply_cap > 0 else 0:.2f}%")
-            print(f"    LTV:                   {borrow_cf:.0f}%")
-            print(f"    Liquidation CF:        {liquidate_cf:.0f}%")
+            emit(f"\n  📈 Market Overview:")
+            emit(f"    Base Asset:            {base_symbol}")
+            emit(f"    Total Supply:          {total_supply:,.2f} {base_symbol}")
+            emit(f"    Total Borrow:          {total_borrow:,.2f} {base_symbol}")
+            emit(f"    Supply APY:            {supply_rate:.2f}%")
+            emit(f"    Borrow APY:            {borrow_rate:.2f}%")
+            emit(f"    Utilization:           {utilization:.2f}%")
+
+            emit(f"\n  💰 {collateral_symbol} Collateral:")
+            emit(f"    Total Supplied:        {total_collateral_supplied:,.4f} {collateral_symbol}")
+            emit(f"    Supply Cap:            {supply_cap:,.4f} {collateral_symbol}")
+            emit(f"    Cap Utilization:       {(total_collateral_supplied/supply_cap*100) if supply_cap > 0 else 0:.2f}%")
+            emit(f"    LTV:                   {borrow_cf:.0f}%")
+            emit(f"    Liquidation CF:        {liquidate_cf:.0f}%")
 
             # Skip CLR if no collateral supplied
             if total_collateral_supplied == 0:
-                print(f"\n  ℹ️  No {collateral_symbol} collateral supplied - skipping CLR")
+                emit(f"\n  ℹ️  No {collateral_symbol} collateral supplied - skipping CLR")
                 market_result["clr"] = {"error": "No collateral supplied"}
                 result["markets"].append(market_result)
                 continue
 
             # CLR Calculation
-            print(f"\n  ⚠️  Calculating CLR...")
+            emit(f"\n  ⚠️  Calculating CLR...")
 
             # Fetch borrowers from subgraph
             borrowers = fetch_positions_from_subgraph(
                 chain_config['subgraph'],
                 comet_address,
-                limit=100
+                limit=100,
+                emit=emit
             )
 
             if not borrowers:
-                print(f"    ⚠️  No borrower data from subgraph - CLR unavailable")
+                emit(f"    ⚠️  No borrower data from subgraph - CLR unavailable")
                 market_result["clr"] = {"error": "No borrower data from subgraph"}
                 result["markets"].append(market_result)
                 continue
 
-            print(f"    Fetching data for {len(borrowers)} borrowers...")
+            emit(f"    Fetching data for {len(borrowers)} borrowers...")
 
             # Get prices
             collateral_price = comet.functions.getPrice(asset_info[2]).call() / 1e8  # Price feed returns 8 decimals
@@ -355,7 +359,7 @@ def analyze_compound_market(collateral_address, chain_name, chain_config):
                 }
             }
 
-            print(f"\n    Health Factor Distribution:")
+            emit(f"\n    Health Factor Distribution:")
             bucket_labels = {
                 "critical": "Critical (HF < 1.0)",
                 "high_risk": "High Risk (1.0 ≤ HF < 1.05)",
@@ -366,12 +370,12 @@ def analyze_compound_market(collateral_address, chain_name, chain_config):
             for bucket_key, positions in risk_buckets.items():
                 count = len(positions)
                 pct = (count / total_positions * 100) if total_positions > 0 else 0
-                print(f"      {bucket_labels[bucket_key]}: {count} positions ({pct:.1f}%)")
+                emit(f"      {bucket_labels[bucket_key]}: {count} positions ({pct:.1f}%)")
 
-            print(f"\n    CLR (by count):        {clr_count:.2f}%")
-            print(f"    CLR (by value):        {clr_value:.2f}%")
-            print(f"    Positions Analyzed:    {total_positions}")
-            print(f"    Debt Analyzed:         {total_debt_analyzed:,.2f} {base_symbol}")
+            emit(f"\n    CLR (by count):        {clr_count:.2f}%")
+            emit(f"    CLR (by value):        {clr_value:.2f}%")
+            emit(f"    Positions Analyzed:    {total_positions}")
+            emit(f"    Debt Analyzed:         {total_debt_analyzed:,.2f} {base_symbol}")
 
             result["markets"].append(market_result)
 
@@ -379,7 +383,7 @@ def analyze_compound_market(collateral_address, chain_name, chain_config):
         return result
 
     except Exception as e:
-        print(f"❌ Error: {e}")
+        emit(f"❌ Error: {e}")
         result["error"] = str(e)
         return result
 
@@ -0,0 +1,98 @@
+"""
+Disk Cache Helpers - Per-user JSON cache files shared by the data fetchers.
+
+Every module that caches API or RPC responses across runs keeps its files
+under CACHE_DIR (created 0700, so other local users cannot read or plant
+entries). Writes are atomic and best-effort: a failed write never breaks
+the caller, it only costs a cache miss on the next run.
+"""
+
+import json
+import math
+import os
+import tempfile
+import time
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "risk_framework"
+)
+
+
+def cache_path(*parts: str) -> str:
+    """Path of a file or subdirectory inside CACHE_DIR."""
+    return os.path.join(CACHE_DIR, *parts)
+
+
+def read_json(path: str):
+    """Load a JSON cache file, or None if it is missing or unreadable."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_json(path: str, data) -> bool:
+    """Write data to path as JSON, replacing the file atomically.
+
+    Missing directories are created with mode 0700. Returns False (leaving
+    no temporary file behind) if the write fails.
+    """
+    directory = os.path.dirname(path)
+    try:
+        # makedirs only applies mode to the leaf, so create CACHE_DIR first
+        if os.path.commonpath([CACHE_DIR, os.path.abspath(directory)]) == CACHE_DIR:
+            os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    except OSError:
+        return False
+
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def valid_fetched_at(entry) -> bool:
+    """True if entry is a dict whose "fetched_at" is a finite timestamp not in the future."""
+    if not isinstance(entry, dict):
+        return False
+    fetched_at = entry.get("fetched_at")
+    return (
+        isinstance(fetched_at, (int, float))
+        and not isinstance(fetched_at, bool)
+        and math.isfinite(fetched_at)
+        and fetched_at <= time.time()
+    )
+
+
+def is_fresh(entry, ttl: float) -> bool:
+    """True if entry passes valid_fetched_at and is younger than ttl seconds."""
+    return valid_fetched_at(entry) and time.time() - entry["fetched_at"] < ttl
+
+
+def prune_dir(directory: str, max_age: float, max_entries: int):
+    """Delete *.json files older than max_age seconds, then all but the newest max_entries."""
+    try:
+        with os.scandir(directory) as it:
+            files = [(entry.stat().st_mtime, entry.path) for entry in it if entry.name.endswith(".json")]
+    except OSError:
+        return
+
+    files.sort(reverse=True)
+    cutoff = time.time() - max_age
+    for rank, (mtime, path) in enumerate(files):
+        if rank >= max_entries or mtime < cutoff:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
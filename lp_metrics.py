@@ -0,0 +1,110 @@
+"""
+LP Concentration Metrics - HHI and top-N shares from subgraph LP positions.
+
+Shared by the Uniswap V3 and PancakeSwap V3 analyzers, whose subgraphs
+report positions in the same owner / liquidity format. Positions are turned
+into parallel NumPy arrays and aggregated per owner in C.
+"""
+
+import logging
+from operator import itemgetter
+from typing import List, Tuple
+
+import numpy as np
+
+# pandas factorizes owner addresses in C, about twice as fast as numbering
+# them with a dict; it is optional and the dict is used without it
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+logger = logging.getLogger(__name__)
+
+# Largest LPs listed in top_lps (and the widest top-N concentration)
+TOP_LPS = 10
+
+# Integers above 2**53 are not all exactly representable in float64. Most
+# real pools exceed it, so the rounding is only logged once per process
+FLOAT64_EXACT_LIMIT = 2 ** 53
+_float64_warned = False
+
+
+def position_columns(positions: List[dict]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split position records into owner (object) and liquidity (float64) arrays"""
+    owners = np.array(list(map(itemgetter("owner"), positions)), dtype=object)
+    liquidity = np.array(list(map(itemgetter("liquidity"), positions)), dtype=np.float64)
+    return owners, liquidity
+
+
+def concentration_metrics(owners: np.ndarray, liquidity: np.ndarray) -> dict:
+    """Calculate HHI, concentration, and holder metrics from parallel owner / liquidity arrays
+
+    Liquidity is aggregated as float64. V3 liquidity is a uint128, so values
+    above 2**53 are rounded (relative error ~1e-16, far below the precision
+    of the reported shares); a warning is logged the first time it happens.
+    """
+    global _float64_warned
+    if not _float64_warned and liquidity.size and liquidity.max() >= FLOAT64_EXACT_LIMIT:
+        _float64_warned = True
+        logger.warning(
+            "LP liquidity above 2**53 is aggregated as float64 (relative error ~1e-16 per position)"
+        )
+
+    # Aggregate liquidity by owner. Owners are numbered in first-seen order
+    # by hashing (which beats np.unique's string sort), then summed in C
+    if pd is not None:
+        owner_index, unique_owners = pd.factorize(owners)
+        unique_owners = unique_owners.tolist()
+    else:
+        owner_ids = {}
+        owner_index = np.fromiter(
+            (owner_ids.setdefault(owner, len(owner_ids)) for owner in owners),
+            dtype=np.intp, count=len(owners)
+        )
+        unique_owners = list(owner_ids)
+    owner_liquidity = np.bincount(owner_index, weights=liquidity, minlength=len(unique_owners))
+
+    # Calculate total liquidity and unique holders
+    total_liquidity = float(owner_liquidity.sum())
+    unique_holders = len(unique_owners)
+
+    # Calculate market shares and HHI (HHI needs every share, but no order)
+    if total_liquidity:
+        shares = owner_liquidity / total_liquidity * 100
+    else:
+        shares = np.zeros(len(owner_liquidity))
+    hhi = float(np.dot(shares, shares))
+
+    # Rank only the top TOP_LPS owners: partition around the k-th largest
+    # liquidity, then stable-sort everyone tied at or above it so ties
+    # keep first-seen order
+    k = min(TOP_LPS, len(owner_liquidity))
+    if k:
+        threshold = np.partition(owner_liquidity, len(owner_liquidity) - k)[len(owner_liquidity) - k]
+        candidates = np.flatnonzero(owner_liquidity >= threshold)
+        top = candidates[np.argsort(-owner_liquidity[candidates], kind="stable")[:k]]
+    else:
+        top = np.empty(0, dtype=np.intp)
+    cumulative_shares = np.cumsum(shares[top])
+
+    # Top concentrations
+    def get_top_concentration(n: int) -> float:
+        n = min(n, len(cumulative_shares))
+        return float(cumulative_shares[n - 1]) if n else 0.0
+
+    top_lps = [
+        (unique_owners[i], float(owner_liquidity[i]), float(shares[i]))
+        for i in top
+    ]
+
+    return {
+        "unique_holders": unique_holders,
+        "total_liquidity": total_liquidity,
+        "hhi": hhi,
+        "top_1": get_top_concentration(1),
+        "top_3": get_top_concentration(3),
+        "top_5": get_top_concentration(5),
+        "top_10": get_top_concentration(10),
+        "top_lps": top_lps,
+    }
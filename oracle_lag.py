@@ -123,96 +123,112 @@ Oracle Lag Calculator - Compare oracle update timestamps between two chains
 Calculates the time difference between oracle updates on different blockchains
 """
 
-from web3 import Web3
+# web3 and requests are imported where first used: web3 alone takes around a
+# second to import, which --help and --list-chains never need.
 from datetime import datetime
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import argparse
 import sys
+import threading
+import time
+from types import MappingProxyType
+
+from disk_cache import cache_path, is_fresh, read_json, valid_fetched_at, write_json
+from rpc_hedge import RPC_HEDGE_DELAY, hedged_call
 
 # Predefined popular chains with RPC endpoints
 KNOWN_CHAINS = {
     "ethereum": {
         "name": "Ethereum",
         "rpc": "https://eth.llamarpc.com",
+        "fallback_rpcs": ["https://ethereum-rpc.publicnode.com"],
         "chain_id": 1
     },
     "polygon": {
         "name": "Polygon",
         "rpc": "https://polygon-rpc.com",
+        "fallback_rpcs": ["https://polygon-bor-rpc.publicnode.com"],
         "chain_id": 137
     },
     "arbitrum": {
         "name": "Arbitrum",
         "rpc": "https://arb1.arbitrum.io/rpc",
+        "fallback_rpcs": ["https://arbitrum-one-rpc.publicnode.com"],
         "chain_id": 42161
     },
     "optimism": {
         "name": "Optimism",
         "rpc": "https://mainnet.optimism.io",
+        "fallback_rpcs": ["https://optimism-rpc.publicnode.com"],
         "chain_id": 10
     },
     "avalanche": {
         "name": "Avalanche",
         "rpc": "https://api.avax.network/ext/bc/C/rpc",
+        "fallback_rpcs": ["https://avalanche-c-chain-rpc.publicnode.com"],
         "chain_id": 43114
     },
     "bsc": {
         "name": "BSC",
         "rpc": "https://bsc-dataseed.binance.org",
+        "fallback_rpcs": ["https://bsc-rpc.publicnode.com"],
         "chain_id": 56
     },
     "base": {
         "name": "Base",
         "rpc": "https://mainnet.base.org",
+        "fallback_rpcs": ["https://base-rpc.publicnode.com"],
         "chain_id": 8453
     },
     "gnosis": {
         "name": "Gnosis",
         "rpc": "https://rpc.gnosischain.com",
+        "fallback_rpcs": ["https://gnosis-rpc.publicnode.com"],
         "chain_id": 100
     }
 }
 
-# Chainlink AggregatorV3 ABI (minimal) + fallback for adapters
-ORACLE_ABI = json.loads('''[
-    {
-        "inputs": [],
-        "name": "latestRoundData",
-        "outputs": [
-            {"name": "roundId", "type": "uint80"},
-            {"name": "answer", "type": "int256"},
-            {"name": "startedAt", "type": "uint256"},
-            {"name": "updatedAt", "type": "uint256"},
-            {"name": "answeredInRound", "type": "uint80"}
-        ],
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "inputs": [],
-        "name": "latestAnswer",
-        "outputs": [{"name": "", "type": "int256"}],
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "inputs": [],
-        "name": "lastPrice",
-        "outputs": [
-            {"name": "price", "type": "uint256"},
-            {"name": "timestamp", "type": "uint256"}
-        ],
-        "stateMutability": "view",
-        "type": "function"
-    },
-    {
-        "inputs": [],
-        "name": "decimals",
-        "outputs": [{"name": "", "type": "uint8"}],
-        "stateMutability": "view",
-        "type": "function"
-    }
-]''')
+# Freeze the table so get_chain_config can hand entries out without copying
+KNOWN_CHAINS = MappingProxyType({
+    key: MappingProxyType(dict(chain, fallback_rpcs=tuple(chain["fallback_rpcs"])))
+    for key, chain in KNOWN_CHAINS.items()
+})
+
+# Chainlink AggregatorV3 read selectors (+ fallbacks for adapters), sent as raw
+# eth_call data so no contract object or ABI encoding is needed per call
+LATEST_ROUND_DATA_SELECTOR = "0xfeaf968c"  # latestRoundData() -> (uint80,int256,uint256,uint256,uint80)
+LAST_PRICE_SELECTOR = "0x053f14da"         # lastPrice() -> (uint256 price, uint256 timestamp)
+LATEST_ANSWER_SELECTOR = "0x50d25bcd"      # latestAnswer() -> int256
+GET_CHAIN_ID_SELECTOR = "0x3408e470"       # Multicall3.getChainId() -> uint256
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+MULTICALL3_ABI = [
+    {"inputs": [{"components": [{"name": "target", "type": "address"}, {"name": "allowFailure", "type": "bool"}, {"name": "callData", "type": "bytes"}], "name": "calls", "type": "tuple[]"}], "name": "aggregate3", "outputs": [{"components": [{"name": "success", "type": "bool"}, {"name": "returnData", "type": "bytes"}], "name": "returnData", "type": "tuple[]"}], "stateMutability": "payable", "type": "function"}
+]
+
+ROUND_DATA_TYPES = ["uint80", "int256", "uint256", "uint256", "uint80"]
+
+# Chainlink USD feeds report prices with 8 decimals
+PRICE_SCALE = 1e-8
+
+# Timeout (seconds) for every RPC request issued through the shared session
+RPC_TIMEOUT = 10
+
+# Attempts per RPC request on rate limits and timeouts, with exponential backoff
+RPC_RETRIES = 3
+
+# Larger JSON-RPC batches tend to be slower or rejected by public endpoints
+MAX_BATCH_SIZE = 30
+
+# On-disk cache of recent oracle reads, shared across runs (see --cache-ttl)
+ORACLE_CACHE_PATH = cache_path("oracle_lag_cache.json")
+_cache_lock = threading.Lock()
+
+# In-process copy of cache entries, so repeat reads skip the disk as well as the RPC
+_memory_cache = {}
 
 
 def list_available_chains():
@@ -225,13 +241,17 @@ def list_available_chains():
 
 
 def get_chain_config(chain_input, custom_rpc=None):
-    """Get chain configuration from user input"""
-    chain_lower = chain_input.lower()
-    
-    if chain_lower in KNOWN_CHAINS:
-        config = KNOWN_CHAINS[chain_lower].copy()
-        if custom_rpc:
-            config["rpc"] = custom_rpc
+    """Get chain configuration from user input
+
+    Known chains are returned as read-only mappings; a new dict is only
+    built when a custom RPC overrides the defaults.
+    """
+    config = KNOWN_CHAINS.get(chain_input.lower())
+
+    if config is not None:
+        if custom_rpc and custom_rpc != config["rpc"]:
+            # An explicit RPC is used on its own, never hedged with public ones
+            return {**config, "rpc": custom_rpc, "fallback_rpcs": []}
         return config
     else:
         # Custom chain - requires RPC
@@ -244,6 +264,7 @@ def get_chain_config(chain_input, custom_rpc=None):
         return {
             "name": chain_input,
             "rpc": custom_rpc,
+            "fallback_rpcs": [],
             "chain_id": None
         }
 
@@ -323,48 +344,226 @@ Examples:
                        help="Oracle address on chain 2")
     parser.add_argument("--chain2-rpc", type=str,
                        help="Custom RPC endpoint for chain 2")
+    parser.add_argument("--cache-ttl", type=int, default=0,
+                       help="Reuse oracle reads cached on disk for up to N seconds (default: 0, disabled)")
     
     return parser.parse_args()
 
 
+@lru_cache(maxsize=None)
+def _get_session():
+    """Return the keep-alive HTTP session shared by every RPC provider."""
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=32,
+        max_retries=Retry(total=3, backoff_factor=0.2)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+@lru_cache(maxsize=None)
+def _get_w3(rpc_url):
+    """Return a Web3 instance per RPC URL, built once and reused."""
+    import requests
+    from web3 import Web3
+    from web3.providers.rpc.utils import ExceptionRetryConfiguration
+
+    # eth_chainId never changes for an endpoint; web3 asks for it around
+    # every eth_call, so let the provider answer it from its own cache.
+    # Rate limits (429) and timeouts are retried with exponential backoff;
+    # connection errors are already retried by the session's adapter.
+    return Web3(Web3.HTTPProvider(
+        rpc_url,
+        session=_get_session(),
+        request_kwargs={"timeout": RPC_TIMEOUT},
+        cache_allowed_requests=True,
+        cacheable_requests={"eth_chainId"},
+        exception_retry_configuration=ExceptionRetryConfiguration(
+            errors=(requests.exceptions.HTTPError, requests.exceptions.Timeout),
+            retries=RPC_RETRIES,
+            backoff_factor=0.2
+        )
+    ))
+
+
+class ChainMismatchError(ValueError):
+    """The RPC endpoint serves a different chain than the one configured."""
+
+
+@lru_cache(maxsize=None)
+def _rpc_chain_id(rpc_url):
+    """Return the chain id an RPC endpoint serves (asked once per endpoint)."""
+    return _get_w3(rpc_url).eth.chain_id
+
+
+def _check_chain_id(rpc_url, expected_chain_id):
+    """Raise ChainMismatchError unless the RPC serves expected_chain_id (None skips the check)."""
+    if expected_chain_id is None:
+        return
+    chain_id = _rpc_chain_id(rpc_url)
+    if chain_id != expected_chain_id:
+        raise ChainMismatchError(f"RPC {rpc_url} serves chain {chain_id}, expected {expected_chain_id}")
+
+
+def _eth_call(w3, address, selector, output_types):
+    """Run a zero-argument view call from its selector and decode the output."""
+    return w3.codec.decode(output_types, w3.eth.call({"to": address, "data": selector}))
+
+
+def _parse_round_data(round_data):
+    """Convert a latestRoundData() tuple into the oracle data dict.
+
+    A round answered in an earlier round, with a non-positive answer, or
+    never updated is flagged "stale" so callers can skip it.
+    """
+    round_id, answer, _, updated_at, answered_in_round = round_data
+    oracle_data = {
+        "round_id": round_id,
+        "price": answer,
+        "updated_at": updated_at
+    }
+    if answered_in_round < round_id or answer <= 0 or updated_at == 0:
+        oracle_data["stale"] = True
+    return oracle_data
+
+
+def _cache_key(rpc_url, oracle_address):
+    return f"{rpc_url}|{oracle_address.lower()}"
+
+
+def _valid_cache_entry(entry):
+    """A dict with a valid fetched_at and numeric price / updated_at."""
+    return valid_fetched_at(entry) and all(
+        isinstance(entry.get(field), (int, float)) and not isinstance(entry.get(field), bool)
+        for field in ("price", "updated_at")
+    )
+
+
+def _read_cache_file():
+    """Return the well-formed entries of the on-disk cache ({} if missing or corrupt)."""
+    cache = read_json(ORACLE_CACHE_PATH)
+    if not isinstance(cache, dict):
+        return {}
+    return {key: entry for key, entry in cache.items() if _valid_cache_entry(entry)}
+
+
+def _load_cached_oracles(rpc_url, oracle_addresses, cache_ttl):
+    """Return cached reads younger than cache_ttl seconds (else None), aligned with oracle_addresses.
+
+    The cache file is read at most once, and only for reads missing from memory.
+    """
+    keys = [_cache_key(rpc_url, address) for address in oracle_addresses]
+    entries = [_memory_cache.get(key) for key in keys]
+
+    if not all(is_fresh(entry, cache_ttl) for entry in entries):
+        with _cache_lock:
+            saved = _read_cache_file()
+        for i, key in enumerate(keys):
+            if not is_fresh(entries[i], cache_ttl) and key in saved:
+                entries[i] = _memory_cache[key] = saved[key]
+
+    return [
+        {k: v for k, v in entry.items() if k != "fetched_at"} if is_fresh(entry, cache_ttl) else None
+        for entry in entries
+    ]
+
+
+def _load_cached_oracle(rpc_url, oracle_address, cache_ttl):
+    """Return a cached oracle read younger than cache_ttl seconds, else None."""
+    return _load_cached_oracles(rpc_url, [oracle_address], cache_ttl)[0]
+
 
-def get_oracle_data(rpc_url, oracle_address):
+def _store_cached_oracles(reads, cache_ttl):
+    """Persist (rpc_url, oracle_address, oracle_data) reads with one atomic rewrite.
+
+    Entries older than cache_ttl are dropped from memory and from the file.
+    """
+    now = time.time()
+    new_entries = {
+        _cache_key(rpc_url, oracle_address): dict(oracle_data, fetched_at=now)
+        for rpc_url, oracle_address, oracle_data in reads
+        if oracle_data
+    }
+    if not new_entries:
+        return
+
+    with _cache_lock:
+        for key in [key for key, entry in _memory_cache.items() if not is_fresh(entry, cache_ttl)]:
+            del _memory_cache[key]
+        _memory_cache.update(new_entries)
+
+        cache = {key: entry for key, entry in _read_cache_file().items() if is_fresh(entry, cache_ttl)}
+        cache.update(new_entries)
+        write_json(ORACLE_CACHE_PATH, cache)
+
+
+def get_oracle_data(rpc_url, oracle_address, cache_ttl=0, expected_chain_id=None, emit=print):
     """Fetch latest oracle data from a chain.
 
+    Chainlink feeds only move on heartbeat or deviation, so with cache_ttl > 0
+    a read cached (in memory or on disk) within the last cache_ttl seconds is
+    returned without touching the RPC.
+
+    With expected_chain_id, the RPC's chain id is checked first (once per
+    endpoint) and a mismatch is reported as a failed read. Read errors are
+    reported through emit.
+
     Tries methods in order:
     1. latestRoundData() - standard Chainlink AggregatorV3
     2. lastPrice() - RLP Fundamental Oracle (returns price, timestamp)
     3. latestAnswer() - adapters without timestamp (uses current time as proxy)
     """
-    try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
-        if not w3.is_connected():
-            raise ConnectionError(f"Failed to connect to {rpc_url}")
+    if cache_ttl > 0:
+        oracle_data = _load_cached_oracle(rpc_url, oracle_address, cache_ttl)
+        if oracle_data:
+            return oracle_data
+
+    oracle_data = _fetch_oracle_data(rpc_url, oracle_address, expected_chain_id, emit)
+    if cache_ttl > 0:
+        _store_cached_oracles([(rpc_url, oracle_address, oracle_data)], cache_ttl)
+    return oracle_data
+
 
-        contract = w3.eth.contract(address=oracle_address, abi=ORACLE_ABI)
+def _fetch_oracle_data(rpc_url, oracle_address, expected_chain_id=None, emit=print):
+    import requests
+    from web3 import Web3
 
-        # Try latestRoundData first (standard Chainlink feeds)
+    try:
+        w3 = _get_w3(rpc_url)
+        oracle = Web3.to_checksum_address(oracle_address)
+        _check_chain_id(rpc_url, expected_chain_id)
+
+        # Try latestRoundData first (standard Chainlink feeds). No is_connected()
+        # preflight: an unreachable RPC surfaces here, and is not worth
+        # retrying with the fallback methods below. Only contract errors
+        # (revert, undecodable output) mean the oracle needs another method.
         try:
-            round_data = contract.functions.latestRoundData().call()
-            return {
-                "round_id": round_data[0],
-                "price": round_data[1],
-                "updated_at": round_data[3],
-                "timestamp": datetime.fromtimestamp(round_data[3])
-            }
+            return _parse_round_data(_eth_call(w3, oracle, LATEST_ROUND_DATA_SELECTOR, ROUND_DATA_TYPES))
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+            raise
+        except requests.exceptions.HTTPError as e:
+            # Rate limits and server errors persisted through the provider's
+            # retries; the fallback methods would fail the same way
+            status_code = getattr(e.response, "status_code", None)
+            if status_code == 429 or (status_code or 0) >= 500:
+                raise
         except Exception:
             pass
 
         # Fallback to lastPrice() for RLP Fundamental Oracle
         try:
-            last_price_data = contract.functions.lastPrice().call()
-            price = last_price_data[0]
-            timestamp = last_price_data[1]
+            price, timestamp = _eth_call(w3, oracle, LAST_PRICE_SELECTOR, ["uint256", "uint256"])
             return {
                 "round_id": 0,  # Not available for this oracle type
                 "price": price,
                 "updated_at": timestamp,
-                "timestamp": datetime.fromtimestamp(timestamp),
                 "oracle_type": "lastPrice"
             }
         except Exception:
@@ -372,25 +571,285 @@ def get_oracle_data(rpc_url, oracle_address):
 
         # Final fallback to latestAnswer() for adapters (no timestamp available)
         try:
-            import time
-            answer = contract.functions.latestAnswer().call()
+            (answer,) = _eth_call(w3, oracle, LATEST_ANSWER_SELECTOR, ["int256"])
             current_time = int(time.time())
             return {
                 "round_id": 0,  # Not available for adapters
                 "price": answer,
                 "updated_at": current_time,  # Use current time as proxy
-                "timestamp": datetime.fromtimestamp(current_time),
                 "is_adapter": True  # Flag that this is an adapter without timestamp
             }
         except Exception as e:
-            print(f"All oracle methods failed: {e}")
+            emit(f"All oracle methods failed: {e}")
             return None
 
     except Exception as e:
-        print(f"Error fetching data: {e}")
+        emit(f"Error fetching data: {e}")
         return None
 
 
+def get_oracle_data_batch(rpc_url, oracle_addresses, expected_chain_id=None):
+    """Fetch latestRoundData() for several oracles on one RPC in JSON-RPC batches.
+
+    All eth_calls for up to MAX_BATCH_SIZE oracles travel in a single HTTP
+    request. If a batch fails (unsupported by the endpoint, or an oracle
+    without latestRoundData), its oracles are fetched one by one through
+    get_oracle_data so the fallback methods still apply.
+
+    With expected_chain_id, nothing is read from an RPC serving another chain.
+
+    Returns:
+        List of oracle data dicts (or None) aligned with oracle_addresses
+    """
+    from web3 import Web3
+
+    try:
+        _check_chain_id(rpc_url, expected_chain_id)
+    except Exception as e:
+        print(f"Error fetching data: {e}")
+        return [None] * len(oracle_addresses)
+
+    results = []
+    for start in range(0, len(oracle_addresses), MAX_BATCH_SIZE):
+        chunk = oracle_addresses[start:start + MAX_BATCH_SIZE]
+        try:
+            w3 = _get_w3(rpc_url)
+            with w3.batch_requests() as batch:
+                for oracle_address in chunk:
+                    batch.add(w3.eth.call({
+                        "to": Web3.to_checksum_address(oracle_address),
+                        "data": LATEST_ROUND_DATA_SELECTOR
+                    }))
+                responses = batch.execute()
+            results.extend(
+                _parse_round_data(w3.codec.decode(ROUND_DATA_TYPES, raw)) for raw in responses
+            )
+        except Exception:
+            results.extend(get_oracle_data(rpc_url, oracle_address) for oracle_address in chunk)
+    return results
+
+
+def multicall_latest_round_data(rpc_url, oracle_addresses, expected_chain_id=None):
+    """Fetch latestRoundData() for several oracles on one chain in a single eth_call.
+
+    Calls are routed through Multicall3.aggregate3 with allowFailure set, so
+    an oracle that reverts (e.g. an adapter without latestRoundData) does not
+    sink the others; it is fetched individually via get_oracle_data instead.
+
+    With expected_chain_id, Multicall3.getChainId() rides along in the same
+    aggregate so the RPC is checked against the configured chain for free
+    (if that sub-call fails, the chain id is asked for separately).
+
+    Raises:
+        ChainMismatchError if the RPC reports a different chain id
+        Exception if the aggregate call itself fails (e.g. no Multicall3 on the chain)
+
+    Returns:
+        List of oracle data dicts (or None) aligned with oracle_addresses
+    """
+    from web3 import Web3
+
+    w3 = _get_w3(rpc_url)
+    multicall = w3.eth.contract(address=MULTICALL3, abi=MULTICALL3_ABI)
+
+    calls = [
+        (Web3.to_checksum_address(oracle_address), True, LATEST_ROUND_DATA_SELECTOR)
+        for oracle_address in oracle_addresses
+    ]
+    if expected_chain_id is not None:
+        calls.append((MULTICALL3, True, GET_CHAIN_ID_SELECTOR))
+
+    responses = multicall.functions.aggregate3(calls).call()
+
+    if expected_chain_id is not None:
+        success, return_data = responses.pop()
+        if success and return_data:
+            (chain_id,) = w3.codec.decode(["uint256"], return_data)
+            if chain_id != expected_chain_id:
+                raise ChainMismatchError(
+                    f"RPC {rpc_url} serves chain {chain_id}, expected {expected_chain_id}"
+                )
+        else:
+            _check_chain_id(rpc_url, expected_chain_id)
+
+    results = []
+    for oracle_address, (success, return_data) in zip(oracle_addresses, responses):
+        if success and return_data:
+            results.append(_parse_round_data(w3.codec.decode(ROUND_DATA_TYPES, return_data)))
+        else:
+            results.append(get_oracle_data(rpc_url, oracle_address))
+    return results
+
+
+def get_oracle_data_failover(rpc_urls, oracle_address, expected_chain_id=None):
+    """Fetch oracle data from several RPC endpoints for the same chain.
+
+    The primary endpoint is read first; a fallback is only started once the
+    reads in flight have failed or taken longer than RPC_HEDGE_DELAY (see
+    rpc_hedge.hedged_call). With a single endpoint this is just
+    get_oracle_data. With expected_chain_id, an endpoint serving another
+    chain counts as failed. Only the last error is printed, and only if
+    every endpoint failed, so a slow endpoint beaten by a fallback is silent.
+
+    Returns:
+        Oracle data dict, or None if every endpoint failed
+    """
+    if len(rpc_urls) == 1:
+        return get_oracle_data(rpc_urls[0], oracle_address, expected_chain_id=expected_chain_id)
+
+    errors = []
+    oracle_data = hedged_call(
+        lambda rpc_url: get_oracle_data(
+            rpc_url, oracle_address, expected_chain_id=expected_chain_id, emit=errors.append
+        ),
+        rpc_urls,
+        RPC_HEDGE_DELAY
+    )
+    if oracle_data is None and errors:
+        print(errors[-1])
+    return oracle_data
+
+
+def _rpc_urls(chain_config):
+    """Primary RPC followed by any fallbacks configured for the chain."""
+    return [chain_config["rpc"]] + list(chain_config.get("fallback_rpcs", []))
+
+
+def fetch_oracles(oracle_requests, max_workers=8):
+    """Fetch many oracles concurrently with a bounded thread pool.
+
+    Requests that share an RPC and chain are coalesced into one Multicall3 eth_call
+    (see fetch_chain_oracles), with any failures retried on the chain's
+    fallback RPCs. A lone request on an RPC is hedged across the chain's
+    endpoints (see get_oracle_data_failover). Every path checks the
+    RPC against the configured chain id. max_workers caps how many RPCs are
+    queried at once.
+
+    Args:
+        oracle_requests: List of (chain_config, oracle_address) tuples
+        max_workers: Maximum number of concurrent fetches
+
+    Returns:
+        List of oracle data dicts (or None) aligned with oracle_requests
+    """
+    if not oracle_requests:
+        return []
+
+    # Group request indices by (RPC, chain id), keeping the first config seen for each
+    groups = {}
+    for index, (chain_config, _) in enumerate(oracle_requests):
+        key = (chain_config["rpc"], chain_config.get("chain_id"))
+        groups.setdefault(key, (chain_config, []))[1].append(index)
+
+    def fetch_group(group):
+        chain_config, indices = group
+        chain_id = chain_config.get("chain_id")
+        addresses = [oracle_requests[i][1] for i in indices]
+        if len(addresses) == 1:
+            return indices, [get_oracle_data_failover(_rpc_urls(chain_config), addresses[0], chain_id)]
+
+        group_results = fetch_chain_oracles(chain_config, addresses)
+        fallback_rpcs = list(chain_config.get("fallback_rpcs", []))
+        if fallback_rpcs:
+            group_results = [
+                oracle_data or get_oracle_data_failover(fallback_rpcs, address, chain_id)
+                for address, oracle_data in zip(addresses, group_results)
+            ]
+        return indices, group_results
+
+    results = [None] * len(oracle_requests)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as executor:
+        for indices, group_results in executor.map(fetch_group, groups.values()):
+            for index, oracle_data in zip(indices, group_results):
+                results[index] = oracle_data
+    return results
+
+
+def fetch_chain_oracles(chain_config, oracle_addresses, cache_ttl=0):
+    """Fetch several oracles on one chain in a single Multicall3 eth_call.
+
+    The aggregate also verifies the RPC's chain id against the configured
+    one. Chains without Multicall3 fall back to JSON-RPC batched eth_calls,
+    which still cost one HTTP round-trip per MAX_BATCH_SIZE oracles.
+
+    Args:
+        cache_ttl: Seconds a cached read stays valid (0 disables the cache)
+
+    Returns:
+        List of oracle data dicts (or None) aligned with oracle_addresses
+    """
+    rpc_url = chain_config["rpc"]
+
+    results = [None] * len(oracle_addresses)
+    if cache_ttl > 0:
+        results = _load_cached_oracles(rpc_url, oracle_addresses, cache_ttl)
+
+    missing = [i for i, oracle_data in enumerate(results) if oracle_data is None]
+    if not missing:
+        return results
+    missing_addresses = [oracle_addresses[i] for i in missing]
+
+    try:
+        fetched = multicall_latest_round_data(
+            rpc_url, missing_addresses, expected_chain_id=chain_config.get("chain_id")
+        )
+    except ChainMismatchError as e:
+        print(f"Error fetching data: {e}")
+        fetched = [None] * len(missing_addresses)
+    except Exception:
+        fetched = get_oracle_data_batch(
+            rpc_url, missing_addresses, expected_chain_id=chain_config.get("chain_id")
+        )
+
+    for i, oracle_data in zip(missing, fetched):
+        results[i] = oracle_data
+    if cache_ttl > 0:
+        _store_cached_oracles(
+            [(rpc_url, oracle_addresses[i], results[i]) for i in missing], cache_ttl
+        )
+    return results
+
+
+def fetch_oracle_pair(chain1_config, oracle1_address, chain2_config, oracle2_address, cache_ttl=0):
+    """Fetch two oracles concurrently.
+
+    Each fetch is a blocking HTTP round-trip to a (usually different) RPC,
+    so running them side by side bounds wall time by the slower chain.
+
+    Args:
+        cache_ttl: Seconds a cached read stays valid (0 disables the cache)
+
+    Returns:
+        Tuple of (chain1_data, chain2_data), either of which may be None
+    """
+    rpc1 = chain1_config["rpc"]
+    rpc2 = chain2_config["rpc"]
+
+    if rpc1 == rpc2 and chain1_config.get("chain_id") == chain2_config.get("chain_id"):
+        # Same endpoint and chain: both reads fit in one Multicall3 eth_call
+        chain1_data, chain2_data = fetch_chain_oracles(
+            chain1_config, [oracle1_address, oracle2_address], cache_ttl
+        )
+        return chain1_data, chain2_data
+
+    if cache_ttl > 0:
+        chain1_data = _load_cached_oracle(rpc1, oracle1_address, cache_ttl)
+        chain2_data = _load_cached_oracle(rpc2, oracle2_address, cache_ttl)
+        if chain1_data and chain2_data:
+            return chain1_data, chain2_data
+
+    chain1_data, chain2_data = fetch_oracles([
+        (chain1_config, oracle1_address),
+        (chain2_config, oracle2_address)
+    ])
+
+    if cache_ttl > 0:
+        _store_cached_oracles(
+            [(rpc1, oracle1_address, chain1_data), (rpc2, oracle2_address, chain2_data)], cache_ttl
+        )
+    return chain1_data, chain2_data
+
+
 def calculate_oracle_freshness(updated_at_timestamp: int) -> dict:
     """
     Calculate how fresh an oracle is based on last update time.
@@ -403,7 +862,6 @@ def calculate_oracle_freshness(updated_at_timestamp: int) -> dict:
     Returns:
         dict with freshness metrics
     """
-    import time
     current_time = time.time()
     seconds_since_update = current_time - updated_at_timestamp
 
@@ -419,7 +877,10 @@ def calculate_oracle_freshness(updated_at_timestamp: int) -> dict:
 def get_oracle_freshness(
     oracle_addresses: list,
     chain_name: str = "ethereum",
-    custom_rpc: str = None
+    custom_rpc: str = None,
+    cache_ttl: int = 0,
+    verbose: bool = True,
+    emit=print
 ) -> dict:
     """
     Get oracle freshness for one or more Chainlink price feeds on a chain.
@@ -428,12 +889,13 @@ def get_oracle_freshness(
         oracle_addresses: List of Chainlink price feed addresses
         chain_name: Chain name (ethereum, base, arbitrum, etc.)
         custom_rpc: Optional custom RPC URL
+        cache_ttl: Seconds a cached oracle read stays valid (0 disables the cache)
+        verbose: Emit the human-readable report (False for library callers)
+        emit: Callable receiving each report block as one string (default print)
 
     Returns:
         dict with freshness data for each oracle and aggregate metrics
     """
-    import time
-
     result = {
         "protocol": "Oracle Freshness",
         "chain": chain_name,
@@ -447,70 +909,100 @@ def get_oracle_freshness(
         result["error"] = f"Unknown chain: {chain_name}"
         return result
 
-    print(f"\n{'='*60}")
-    print(f"ORACLE FRESHNESS CHECK - {chain_config['name']}")
-    print(f"{'='*60}")
+    if verbose:
+        emit(f"\n{'='*60}\nORACLE FRESHNESS CHECK - {chain_config['name']}\n{'='*60}")
 
     freshness_values = []
 
-    for oracle_address in oracle_addresses:
-        print(f"\nChecking oracle: {oracle_address[:10]}...{oracle_address[-8:]}")
+    # All feeds live on one chain, so read them in a single Multicall3 call
+    all_oracle_data = fetch_chain_oracles(chain_config, oracle_addresses, cache_ttl)
 
-        oracle_data = get_oracle_data(chain_config["rpc"], oracle_address)
+    for oracle_address, oracle_data in zip(oracle_addresses, all_oracle_data):
+        # Buffer the block and emit it in one write so reports never interleave
+        lines = [f"\nChecking oracle: {oracle_address[:10]}...{oracle_address[-8:]}"]
 
-        if oracle_data:
+        if oracle_data and oracle_data.get("stale"):
+            # Unusable round: report it but keep it out of the aggregates
+            result["oracles"].append({
+                "address": oracle_address,
+                "round_id": oracle_data["round_id"],
+                "stale": True,
+                "error": "Stale round data"
+            })
+            lines.append(f"  ⚠️  Stale round data (round {oracle_data['round_id']})")
+        elif oracle_data:
             freshness = calculate_oracle_freshness(oracle_data["updated_at"])
 
             oracle_result = {
                 "address": oracle_address,
-                "price": oracle_data["price"] / 10**8,
+                "price": oracle_data["price"] * PRICE_SCALE,
                 "round_id": oracle_data["round_id"],
                 **freshness
             }
             result["oracles"].append(oracle_result)
             freshness_values.append(freshness["minutes_since_update"])
 
-            print(f"  Price: {oracle_data['price'] / 10**8:.8f}")
-            print(f"  Last Update: {freshness['last_update_datetime']}")
-            print(f"  Freshness: {freshness['minutes_since_update']:.2f} minutes ({freshness['hours_since_update']:.2f} hours)")
+            lines.append(f"  Price: {oracle_data['price'] * PRICE_SCALE:.8f}")
+            lines.append(f"  Last Update: {freshness['last_update_datetime']}")
+            lines.append(f"  Freshness: {freshness['minutes_since_update']:.2f} minutes ({freshness['hours_since_update']:.2f} hours)")
         else:
             result["oracles"].append({
                 "address": oracle_address,
                 "error": "Failed to fetch data"
             })
-            print(f"  ⚠️  Failed to fetch data")
+            lines.append(f"  ⚠️  Failed to fetch data")
+
+        if verbose:
+            emit("\n".join(lines))
 
-    # Calculate aggregate metrics
+    # Calculate aggregate metrics in a single pass
     if freshness_values:
+        min_freshness = max_freshness = freshness_values[0]
+        total_freshness = 0.0
+        for value in freshness_values:
+            if value < min_freshness:
+                min_freshness = value
+            elif value > max_freshness:
+                max_freshness = value
+            total_freshness += value
+
         result["aggregate"] = {
-            "min_freshness_minutes": min(freshness_values),
-            "max_freshness_minutes": max(freshness_values),
-            "avg_freshness_minutes": sum(freshness_values) / len(freshness_values),
+            "min_freshness_minutes": min_freshness,
+            "max_freshness_minutes": max_freshness,
+            "avg_freshness_minutes": total_freshness / len(freshness_values),
             "oracles_checked": len(freshness_values)
         }
 
-        print(f"\n{'─'*60}")
-        print(f"AGGREGATE METRICS")
-        print(f"  Freshest Oracle: {result['aggregate']['min_freshness_minutes']:.2f} minutes")
-        print(f"  Stalest Oracle: {result['aggregate']['max_freshness_minutes']:.2f} minutes")
-        print(f"  Average Freshness: {result['aggregate']['avg_freshness_minutes']:.2f} minutes")
+        if verbose:
+            emit("\n".join([
+                f"\n{'─'*60}",
+                "AGGREGATE METRICS",
+                f"  Freshest Oracle: {result['aggregate']['min_freshness_minutes']:.2f} minutes",
+                f"  Stalest Oracle: {result['aggregate']['max_freshness_minutes']:.2f} minutes",
+                f"  Average Freshness: {result['aggregate']['avg_freshness_minutes']:.2f} minutes"
+            ]))
 
         result["status"] = "success"
     else:
         result["error"] = "No oracle data retrieved"
 
-    print(f"{'='*60}\n")
+    if verbose:
+        emit(f"{'='*60}\n")
     return result
 
 
 def get_cross_chain_oracle_freshness(
-    chain_oracles: list
+    chain_oracles: list,
+    verbose: bool = True,
+    emit=print
 ) -> dict:
     """
     Get oracle freshness across multiple chains and calculate cross-chain lag.
 
     Args:
         chain_oracles: List of dicts with keys: chain, oracle_address, rpc (optional)
+        verbose: Emit the human-readable report (False for library callers)
+        emit: Callable receiving each report block as one string (default print)
 
     Returns:
         dict with per-chain freshness and cross-chain lag
@@ -522,18 +1014,27 @@ def get_cross_chain_oracle_freshness(
         "cross_chain_lag": {}
     }
 
-    print(f"\n{'='*60}")
-    print(f"CROSS-CHAIN ORACLE FRESHNESS")
-    print(f"{'='*60}")
+    if verbose:
+        emit(f"\n{'='*60}\nCROSS-CHAIN ORACLE FRESHNESS\n{'='*60}")
 
     all_update_times = []
 
+    # Resolve chain configs up front so every known chain can be fetched concurrently
+    chain_requests = []
     for chain_oracle in chain_oracles:
         chain_name = chain_oracle.get("chain", "unknown")
-        oracle_address = chain_oracle.get("oracle_address")
-        custom_rpc = chain_oracle.get("rpc")
-
-        chain_config = get_chain_config(chain_name, custom_rpc)
+        chain_config = get_chain_config(chain_name, chain_oracle.get("rpc"))
+        chain_requests.append((chain_name, chain_config, chain_oracle.get("oracle_address")))
+
+    # Each chain has its own RPC, so one worker per chain (up to 32) cannot
+    # flood a single endpoint the way fetch_oracles' default cap guards against
+    fetched = iter(fetch_oracles([
+        (chain_config, oracle_address)
+        for _, chain_config, oracle_address in chain_requests
+        if chain_config
+    ], max_workers=32))
+
+    for chain_name, chain_config, oracle_address in chain_requests:
         if not chain_config:
             result["chains"].append({
                 "chain": chain_name,
@@ -541,16 +1042,26 @@ def get_cross_chain_oracle_freshness(
             })
             continue
 
-        print(f"\n{chain_config['name']}:")
-        oracle_data = get_oracle_data(chain_config["rpc"], oracle_address)
+        lines = [f"\n{chain_config['name']}:"]
+        oracle_data = next(fetched)
 
-        if oracle_data:
+        if oracle_data and oracle_data.get("stale"):
+            # Unusable round: report it but keep it out of the cross-chain lag
+            result["chains"].append({
+                "chain": chain_config["name"],
+                "oracle_address": oracle_address,
+                "round_id": oracle_data["round_id"],
+                "stale": True,
+                "error": "Stale round data"
+            })
+            lines.append(f"  ⚠️  Stale round data (round {oracle_data['round_id']})")
+        elif oracle_data:
             freshness = calculate_oracle_freshness(oracle_data["updated_at"])
 
             chain_result = {
                 "chain": chain_config["name"],
                 "oracle_address": oracle_address,
-                "price": oracle_data["price"] / 10**8,
+                "price": oracle_data["price"] * PRICE_SCALE,
                 **freshness
             }
             result["chains"].append(chain_result)
@@ -559,22 +1070,24 @@ def get_cross_chain_oracle_freshness(
                 "updated_at": oracle_data["updated_at"]
             })
 
-            print(f"  Oracle: {oracle_address[:10]}...{oracle_address[-8:]}")
-            print(f"  Price: {oracle_data['price'] / 10**8:.8f}")
-            print(f"  Freshness: {freshness['minutes_since_update']:.2f} minutes")
+            lines.append(f"  Oracle: {oracle_address[:10]}...{oracle_address[-8:]}")
+            lines.append(f"  Price: {oracle_data['price'] * PRICE_SCALE:.8f}")
+            lines.append(f"  Freshness: {freshness['minutes_since_update']:.2f} minutes")
         else:
             result["chains"].append({
                 "chain": chain_config["name"],
                 "oracle_address": oracle_address,
                 "error": "Failed to fetch data"
             })
-            print(f"  ⚠️  Failed to fetch data")
+            lines.append(f"  ⚠️  Failed to fetch data")
+
+        if verbose:
+            emit("\n".join(lines))
 
     # Calculate cross-chain lag
     if len(all_update_times) >= 2:
-        sorted_times = sorted(all_update_times, key=lambda x: x["updated_at"], reverse=True)
-        newest = sorted_times[0]
-        oldest = sorted_times[-1]
+        newest = max(all_update_times, key=lambda x: x["updated_at"])
+        oldest = min(all_update_times, key=lambda x: x["updated_at"])
 
         lag_seconds = newest["updated_at"] - oldest["updated_at"]
 
@@ -585,11 +1098,14 @@ def get_cross_chain_oracle_freshness(
             "oldest_chain": oldest["chain"]
         }
 
-        print(f"\n{'─'*60}")
-        print(f"CROSS-CHAIN LAG")
-        print(f"  Lag: {lag_seconds} seconds ({lag_seconds/60:.2f} minutes)")
-        print(f"  Newest: {newest['chain']}")
-        print(f"  Oldest: {oldest['chain']}")
+        if verbose:
+            emit("\n".join([
+                f"\n{'─'*60}",
+                "CROSS-CHAIN LAG",
+                f"  Lag: {lag_seconds} seconds ({lag_seconds/60:.2f} minutes)",
+                f"  Newest: {newest['chain']}",
+                f"  Oldest: {oldest['chain']}"
+            ]))
 
         result["status"] = "success"
     elif len(all_update_times) == 1:
@@ -598,7 +1114,8 @@ def get_cross_chain_oracle_freshness(
     else:
         result["error"] = "No oracle data retrieved from any chain"
 
-    print(f"{'='*60}\n")
+    if verbose:
+        emit(f"{'='*60}\n")
     return result
 
 
@@ -611,16 +1128,39 @@ def calculate_lag(chain1_data, chain2_data):
     return lag_seconds
 
 
+def _lag_oracle_data(oracle_data, raw):
+    """Oracle data as stored in analyze_oracle_lag results."""
+    if raw:
+        return {
+            "round_id": oracle_data["round_id"],
+            "price": oracle_data["price"],
+            "updated_at": oracle_data["updated_at"]
+        }
+    return {
+        "round_id": oracle_data["round_id"],
+        "price": oracle_data["price"] * PRICE_SCALE,
+        "updated_at": oracle_data["updated_at"],
+        "timestamp": str(datetime.fromtimestamp(oracle_data["updated_at"]))
+    }
+
+
 def analyze_oracle_lag(
     chain1_name: str,
     oracle1_address: str,
     chain2_name: str,
     oracle2_address: str,
     chain1_rpc: str = None,
-    chain2_rpc: str = None
+    chain2_rpc: str = None,
+    cache_ttl: int = 0,
+    verbose: bool = True,
+    raw: bool = False
 ) -> dict:
     """
     Compare oracle update timestamps between two chains.
+    Reads cached within the last cache_ttl seconds are reused (0 disables the cache).
+    With verbose=False nothing is printed, for callers that only use the dict.
+    With raw=True oracle data keeps the on-chain integer price and omits the
+    formatted timestamp, for batch callers that only compare values.
     Returns dict with lag analysis.
     """
     result = {
@@ -642,51 +1182,61 @@ def analyze_oracle_lag(
     result["chain1"]["rpc"] = chain1_config["rpc"]
     result["chain2"]["rpc"] = chain2_config["rpc"]
 
-    print(f"\n{'='*60}")
-    print("ORACLE LAG CALCULATOR")
-    print(f"{'='*60}")
-    print(f"\nChain 1: {chain1_config['name']}")
-    print(f"  Oracle: {oracle1_address}")
-    print(f"\nChain 2: {chain2_config['name']}")
-    print(f"  Oracle: {oracle2_address}")
-
-    # Fetch data from both chains
-    print(f"\n{'─'*60}")
-    print(f"Fetching data from {chain1_config['name']}...")
-    chain1_data = get_oracle_data(chain1_config["rpc"], oracle1_address)
-
-    print(f"Fetching data from {chain2_config['name']}...")
-    chain2_data = get_oracle_data(chain2_config["rpc"], oracle2_address)
-
-    # Store oracle data in result
-    if chain1_data:
-        result["chain1"]["data"] = {
-            "round_id": chain1_data["round_id"],
-            "price": chain1_data["price"] / 10**8,
-            "updated_at": chain1_data["updated_at"],
-            "timestamp": str(chain1_data["timestamp"])
-        }
-        print(f"\n{chain1_config['name']} Oracle:")
-        print(f"  Round ID: {chain1_data['round_id']}")
-        print(f"  Last Update: {chain1_data['timestamp']}")
-        print(f"  Price: {chain1_data['price'] / 10**8:.8f}")
+    if verbose:
+        print(f"\n{'='*60}")
+        print("ORACLE LAG CALCULATOR")
+        print(f"{'='*60}")
+        print(f"\nChain 1: {chain1_config['name']}")
+        print(f"  RPC: {chain1_config['rpc']}")
+        print(f"  Oracle: {oracle1_address}")
+        print(f"\nChain 2: {chain2_config['name']}")
+        print(f"  RPC: {chain2_config['rpc']}")
+        print(f"  Oracle: {oracle2_address}")
+
+        # Fetch data from both chains concurrently
+        print(f"\n{'─'*60}")
+        print(f"Fetching data from {chain1_config['name']} and {chain2_config['name']}...")
+    chain1_data, chain2_data = fetch_oracle_pair(
+        chain1_config, oracle1_address, chain2_config, oracle2_address, cache_ttl=cache_ttl
+    )
+
+    # Store oracle data in result (a stale round is reported but not compared)
+    if chain1_data and chain1_data.get("stale"):
+        if verbose:
+            print(f"\n⚠️  Stale round data from {chain1_config['name']} (round {chain1_data['round_id']})")
+        result["chain1"]["data"] = None
+        result["chain1"]["stale"] = True
+        chain1_data = None
+    elif chain1_data:
+        result["chain1"]["data"] = _lag_oracle_data(chain1_data, raw)
+        if verbose:
+            print(f"\n{chain1_config['name']} Oracle:")
+            print(f"  Round ID: {chain1_data['round_id']}")
+            print(f"  Last Update: {datetime.fromtimestamp(chain1_data['updated_at'])}")
+            print(f"  Unix Timestamp: {chain1_data['updated_at']}")
+            print(f"  Price: {chain1_data['price'] * PRICE_SCALE:.8f}")
     else:
-        print(f"\n⚠️  Failed to fetch data from {chain1_config['name']}")
+        if verbose:
+            print(f"\n⚠️  Failed to fetch data from {chain1_config['name']}")
         result["chain1"]["data"] = None
 
-    if chain2_data:
-        result["chain2"]["data"] = {
-            "round_id": chain2_data["round_id"],
-            "price": chain2_data["price"] / 10**8,
-            "updated_at": chain2_data["updated_at"],
-            "timestamp": str(chain2_data["timestamp"])
-        }
-        print(f"\n{chain2_config['name']} Oracle:")
-        print(f"  Round ID: {chain2_data['round_id']}")
-        print(f"  Last Update: {chain2_data['timestamp']}")
-        print(f"  Price: {chain2_data['price'] / 10**8:.8f}")
+    if chain2_data and chain2_data.get("stale"):
+        if verbose:
+            print(f"\n⚠️  Stale round data from {chain2_config['name']} (round {chain2_data['round_id']})")
+        result["chain2"]["data"] = None
+        result["chain2"]["stale"] = True
+        chain2_data = None
+    elif chain2_data:
+        result["chain2"]["data"] = _lag_oracle_data(chain2_data, raw)
+        if verbose:
+            print(f"\n{chain2_config['name']} Oracle:")
+            print(f"  Round ID: {chain2_data['round_id']}")
+            print(f"  Last Update: {datetime.fromtimestamp(chain2_data['updated_at'])}")
+            print(f"  Unix Timestamp: {chain2_data['updated_at']}")
+            print(f"  Price: {chain2_data['price'] * PRICE_SCALE:.8f}")
     else:
-        print(f"\n⚠️  Failed to fetch data from {chain2_config['name']}")
+        if verbose:
+            print(f"\n⚠️  Failed to fetch data from {chain2_config['name']}")
         result["chain2"]["data"] = None
 
     # Calculate lag
@@ -702,19 +1252,21 @@ def analyze_oracle_lag(
         else:
             result["ahead_chain"] = "synchronized"
 
-        print("\n" + "=" * 60)
-        print(f"ORACLE LAG: {lag} seconds ({lag/60:.2f} minutes)")
-        print("=" * 60)
+        if verbose:
+            print("\n" + "=" * 60)
+            print(f"ORACLE LAG: {lag} seconds ({lag/60:.2f} minutes)")
+            print("=" * 60)
 
-        if result["ahead_chain"] == "synchronized":
-            print("✓ Both oracles are synchronized!")
-        else:
-            print(f"✓ {result['ahead_chain']} is ahead by {lag} seconds")
-        print("=" * 60)
+            if result["ahead_chain"] == "synchronized":
+                print("✓ Both oracles are synchronized!")
+            else:
+                print(f"✓ {result['ahead_chain']} is ahead by {lag} seconds")
+            print("=" * 60)
 
         result["status"] = "success"
     else:
-        print("\n⚠️  Unable to calculate lag due to missing data")
+        if verbose:
+            print("\n⚠️  Unable to calculate lag due to missing data")
         result["error"] = "Unable to calculate lag due to missing data"
 
     return result
@@ -759,64 +1311,16 @@ def main():
         chain1_oracle = user_input["chain1"]["oracle"]
         chain2_oracle = user_input["chain2"]["oracle"]
     
-    # Display configuration
-    print("\n" + "=" * 60)
-    print("ORACLE LAG CALCULATOR")
-    print("=" * 60)
-    print(f"\nChain 1: {chain1_config['name']}")
-    print(f"  RPC: {chain1_config['rpc']}")
-    print(f"  Oracle: {chain1_oracle}")
-    print(f"\nChain 2: {chain2_config['name']}")
-    print(f"  RPC: {chain2_config['rpc']}")
-    print(f"  Oracle: {chain2_oracle}")
-    
-    # Fetch data from both chains
-    print(f"\n{'─' * 60}")
-    print(f"Fetching data from {chain1_config['name']}...")
-    chain1_data = get_oracle_data(chain1_config["rpc"], chain1_oracle)
-    
-    print(f"Fetching data from {chain2_config['name']}...")
-    chain2_data = get_oracle_data(chain2_config["rpc"], chain2_oracle)
-    
-    # Display results
-    if chain1_data:
-        print(f"\n{chain1_config['name']} Oracle:")
-        print(f"  Round ID: {chain1_data['round_id']}")
-        print(f"  Last Update: {chain1_data['timestamp']}")
-        print(f"  Unix Timestamp: {chain1_data['updated_at']}")
-        print(f"  Price: {chain1_data['price'] / 10**8:.8f}")
-    else:
-        print(f"\n⚠️  Failed to fetch data from {chain1_config['name']}")
-    
-    if chain2_data:
-        print(f"\n{chain2_config['name']} Oracle:")
-        print(f"  Round ID: {chain2_data['round_id']}")
-        print(f"  Last Update: {chain2_data['timestamp']}")
-        print(f"  Unix Timestamp: {chain2_data['updated_at']}")
-        print(f"  Price: {chain2_data['price'] / 10**8:.8f}")
-    else:
-        print(f"\n⚠️  Failed to fetch data from {chain2_config['name']}")
-    
-    # Calculate lag
-    lag = calculate_lag(chain1_data, chain2_data)
-    if lag is not None:
-        print("\n" + "=" * 60)
-        print(f"ORACLE LAG: {lag} seconds ({lag/60:.2f} minutes)")
-        print("=" * 60)
-        
-        # Determine which is ahead
-        if chain1_data["updated_at"] > chain2_data["updated_at"]:
-            print(f"✓ {chain1_config['name']} is ahead by {lag} seconds")
-        elif chain1_data["updated_at"] < chain2_data["updated_at"]:
-            print(f"✓ {chain2_config['name']} is ahead by {lag} seconds")
-        else:
-            print("✓ Both oracles are synchronized!")
-        
-        print("=" * 60)
-    else:
-        print("\n⚠️  Unable to calculate lag due to missing data")
-        sys.exit(1)
+    result = analyze_oracle_lag(
+        chain1_config["name"], chain1_oracle,
+        chain2_config["name"], chain2_oracle,
+        chain1_rpc=chain1_config["rpc"],
+        chain2_rpc=chain2_config["rpc"],
+        cache_ttl=args.cache_ttl
+    )
 
+    if result["status"] != "success":
+        sys.exit(1)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
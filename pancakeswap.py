@@ -4,10 +4,29 @@ PancakeSwap V3 Pool Analyzer
 Analyzes TVL, holder concentration (HHI), and LP distribution
 """
 
+import hashlib
+import itertools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+import numpy as np
 import requests
-from collections import defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, List, Tuple
 
+from disk_cache import cache_path, prune_dir, read_json, valid_fetched_at, write_json
+from lp_metrics import concentration_metrics, position_columns
+
+# orjson parses large position pages several times faster than stdlib json;
+# it is optional and the analyzer falls back to response.json() without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # The Graph Subgraph IDs for PancakeSwap V3
 PANCAKESWAP_SUBGRAPH_IDS = {
     "ethereum": "CJYGNhb7RvnhfBDjqpRnD3oxgyhibzc7fkAMa38YV3oS",
@@ -18,12 +37,97 @@ PANCAKESWAP_SUBGRAPH_IDS = {
 
 GRAPH_API_BASE = "https://gateway.thegraph.com/api"
 
+# With cache_ttl > 0, subgraph responses are cached in memory (LRU, at most
+# GRAPH_MEMORY_CACHE_SIZE entries) and in the per-user cache directory (one
+# file per query, kept to GRAPH_DISK_CACHE_SIZE files no older than
+# GRAPH_DISK_CACHE_MAX_AGE), so repeat analyses of a pool skip The Graph
+GRAPH_CACHE_DIR = cache_path("pancakeswap_graph")
+GRAPH_CACHE_TTL = 300  # Suggested cache_ttl for callers that opt in (seconds)
+GRAPH_MEMORY_CACHE_SIZE = 128
+GRAPH_DISK_CACHE_SIZE = 1024
+GRAPH_DISK_CACHE_MAX_AGE = 86400
+
+# key -> (fetched_at, result), least recently used first
+_query_cache = OrderedDict()
+_query_cache_lock = threading.Lock()
+
+# The disk cache is pruned on the first and then every GRAPH_DISK_PRUNE_INTERVAL-th write
+GRAPH_DISK_PRUNE_INTERVAL = 64
+_disk_writes = itertools.count()
+
+# Positions requested per subgraph page
+POSITIONS_PAGE_SIZE = 500
+
+def _get_memory_cached(key: str, cache_ttl: int):
+    """Return an in-memory (fetched_at, result) younger than cache_ttl, dropping it if expired."""
+    with _query_cache_lock:
+        cached = _query_cache.get(key)
+        if cached is None:
+            return None
+        if time.time() - cached[0] >= cache_ttl:
+            del _query_cache[key]
+            return None
+        _query_cache.move_to_end(key)
+        return cached
+
+
+def _put_memory_cached(key: str, cached: tuple):
+    """Store a response in the in-memory LRU, evicting the least recently used beyond its size."""
+    with _query_cache_lock:
+        _query_cache[key] = cached
+        _query_cache.move_to_end(key)
+        while len(_query_cache) > GRAPH_MEMORY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+
+
+def _pool_selection(pool_address: str) -> str:
+    """GraphQL selection for pool information (TVL, token amounts, etc.)"""
+    return f"""
+          pool(id: "{pool_address.lower()}") {{
+            id
+            token0 {{
+              id
+              symbol
+              decimals
+            }}
+            token1 {{
+              id
+              symbol
+              decimals
+            }}
+            totalValueLockedToken0
+            totalValueLockedToken1
+            totalValueLockedUSD
+            liquidity
+            feeTier
+          }}"""
+
+
+def _positions_selection(pool_address: str, last_id: str, first: int) -> str:
+    """GraphQL selection for the page of active positions following last_id"""
+    return f"""
+          positions(
+            first: {first}
+            orderBy: id
+            orderDirection: asc
+            where: {{pool: "{pool_address.lower()}", liquidity_gt: "0", id_gt: "{last_id}"}}
+          ) {{
+            id
+            owner
+            liquidity
+          }}"""
+
 
 class PancakeSwapV3Analyzer:
-    def __init__(self, network: str, api_key: str = "", subgraph_id: str = None):
-        """Initialize analyzer for specific network"""
+    def __init__(self, network: str, api_key: str = "", subgraph_id: str = None, verbose: bool = True):
+        """Initialize analyzer for specific network
+
+        With verbose=False nothing is printed (including pagination progress),
+        for callers that only use the returned result.
+        """
         self.network = network
         self.api_key = api_key
+        self.verbose = verbose
 
         # Use provided subgraph_id or fall back to defaults
         if subgraph_id:
@@ -34,129 +138,175 @@ class PancakeSwapV3Analyzer:
             raise ValueError(f"No subgraph ID for network: {network}. Please provide subgraph_id.")
 
         self.endpoint = f"{GRAPH_API_BASE}/{api_key}/subgraphs/id/{self.subgraph_id}"
+
+        # One session per analyzer so every query reuses the gateway connection.
+        # GraphQL queries are reads, so POSTs are retried on rate limits and 5xx
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.5,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["POST"]),
+                raise_on_status=False
+            )
+        ))
     
-    def query_subgraph(self, query: str) -> dict:
-        """Execute GraphQL query against The Graph"""
-        response = requests.post(self.endpoint, json={"query": query})
+    def _print(self, *args, **kwargs):
+        if self.verbose:
+            print(*args, **kwargs)
+
+    def query_subgraph(self, query: str, cache_ttl: int = 0) -> dict:
+        """Execute GraphQL query against The Graph
+
+        With cache_ttl > 0, a response cached (in memory or on disk) within
+        the last cache_ttl seconds is returned without a request.
+        """
+        if cache_ttl <= 0:
+            return self._post_query(query)
+
+        key = hashlib.blake2b(f"{self.subgraph_id}\0{query}".encode(), digest_size=16).hexdigest()
+        cached = _get_memory_cached(key, cache_ttl) or self._read_cached_query(key)
+        if cached and time.time() - cached[0] < cache_ttl:
+            _put_memory_cached(key, cached)
+            return cached[1]
+
+        result = self._post_query(query)
+        if "errors" not in result:
+            cached = (time.time(), result)
+            _put_memory_cached(key, cached)
+            self._write_cached_query(key, cached)
+        return result
+
+    def _post_query(self, query: str) -> dict:
+        response = self.session.post(self.endpoint, json={"query": query})
         response.raise_for_status()
+        if orjson is not None:
+            return orjson.loads(response.content)
         return response.json()
+
+    @staticmethod
+    def _read_cached_query(key: str):
+        entry = read_json(os.path.join(GRAPH_CACHE_DIR, f"{key}.json"))
+        if not valid_fetched_at(entry) or not isinstance(entry.get("result"), dict):
+            return None
+        return entry["fetched_at"], entry["result"]
+
+    @staticmethod
+    def _write_cached_query(key: str, cached: tuple):
+        """Persist a response, replacing the cache file atomically."""
+        if next(_disk_writes) % GRAPH_DISK_PRUNE_INTERVAL == 0:
+            prune_dir(GRAPH_CACHE_DIR, GRAPH_DISK_CACHE_MAX_AGE, GRAPH_DISK_CACHE_SIZE - GRAPH_DISK_PRUNE_INTERVAL)
+        write_json(os.path.join(GRAPH_CACHE_DIR, f"{key}.json"), {"fetched_at": cached[0], "result": cached[1]})
     
-    def get_pool_data(self, pool_address: str) -> dict:
+    def get_pool_data(self, pool_address: str, cache_ttl: int = 0) -> dict:
         """Get pool information (TVL, token amounts, etc.)"""
-        query = f"""
-        {{
-          pool(id: "{pool_address.lower()}") {{
-            id
-            token0 {{
-              id
-              symbol
-              decimals
-            }}
-            token1 {{
-              id
-              symbol
-              decimals
-            }}
-            totalValueLockedToken0
-            totalValueLockedToken1
-            totalValueLockedUSD
-            liquidity
-            feeTier
-          }}
-        }}
-        """
-        
-        result = self.query_subgraph(query)
+        query = f"{{{_pool_selection(pool_address)}\n}}"
+
+        result = self.query_subgraph(query, cache_ttl=cache_ttl)
         return result.get("data", {}).get("pool")
-    
-    def get_all_positions(self, pool_address: str, max_positions: int = 500) -> List[dict]:
-        """Fetch LP positions for a pool (paginated, limited to max_positions)"""
-        all_positions = []
-        skip = 0
-        batch_size = min(500, max_positions)
-
-        while len(all_positions) < max_positions:
-            remaining = max_positions - len(all_positions)
-            fetch_size = min(batch_size, remaining)
-
-            query = f"""
-            {{
-              positions(
-                first: {fetch_size}
-                skip: {skip}
-                where: {{pool: "{pool_address.lower()}", liquidity_gt: "0"}}
-              ) {{
-                id
-                owner
-                liquidity
-              }}
-            }}
-            """
 
-            result = self.query_subgraph(query)
-            positions = result.get("data", {}).get("positions", [])
+    def get_positions_page(self, pool_address: str, last_id: str, first: int,
+                           cache_ttl: int = 0) -> List[dict]:
+        """Fetch the page of active LP positions following last_id (ordered by id)"""
+        query = f"{{{_positions_selection(pool_address, last_id, first)}\n}}"
+
+        result = self.query_subgraph(query, cache_ttl=cache_ttl)
+        return result.get("data", {}).get("positions", [])
+
+    def get_pool_with_positions(self, pool_address: str, first: int = POSITIONS_PAGE_SIZE,
+                                cache_ttl: int = 0) -> Tuple[dict, List[dict]]:
+        """Get pool information and the first page of positions in one request
+
+        Both selections go in a single GraphQL document, so an analysis
+        starts with one round-trip instead of two.
+        """
+        query = (
+            f"{{{_pool_selection(pool_address)}"
+            f"{_positions_selection(pool_address, '', first)}\n}}"
+        )
+
+        result = self.query_subgraph(query, cache_ttl=cache_ttl)
+        data = result.get("data") or {}
+        return data.get("pool"), data.get("positions") or []
+
+    def iter_position_pages(self, pool_address: str, max_positions: int = 500,
+                            cache_ttl: int = 0, first_page: List[dict] = None):
+        """Yield pages of LP positions for a pool (limited to max_positions in total)
+
+        Pages are keyed on the last position id seen rather than skip, so
+        each page costs the subgraph the same and The Graph's skip limit
+        (5000) does not cap how many positions can be fetched. A first_page
+        already fetched (see get_pool_with_positions) is used in place of
+        the first request.
+        """
+        fetched = 0
+        last_id = ""
+        batch_size = min(POSITIONS_PAGE_SIZE, max_positions)
 
-            if not positions:
+        while fetched < max_positions:
+            fetch_size = min(batch_size, max_positions - fetched)
+
+            if first_page is not None:
+                positions, first_page = first_page[:fetch_size], None
+            else:
+                positions = self.get_positions_page(pool_address, last_id, fetch_size, cache_ttl)
+            fetched += len(positions)
+
+            self._print(f"  Fetched {fetched} positions...", end="\r")
+            yield positions
+
+            if len(positions) < fetch_size:
                 break
+            last_id = positions[-1]["id"]
 
+        self._print(f"  Total positions fetched: {fetched}")
+
+    def get_all_positions(self, pool_address: str, max_positions: int = 500,
+                          cache_ttl: int = 0, first_page: List[dict] = None) -> List[dict]:
+        """Fetch LP positions for a pool (paginated, limited to max_positions)"""
+        all_positions = []
+        for positions in self.iter_position_pages(pool_address, max_positions, cache_ttl, first_page):
             all_positions.extend(positions)
-            skip += fetch_size
+        return all_positions
 
-            print(f"  Fetched {len(all_positions)} positions...", end="\r")
+    def get_position_arrays(self, pool_address: str, max_positions: int = 500,
+                            cache_ttl: int = 0, first_page: List[dict] = None) -> Dict[str, np.ndarray]:
+        """Fetch LP positions as parallel owner / liquidity arrays
+
+        Each page is converted as soon as it arrives, so the per-position
+        dicts are never held for the whole pool.
+        """
+        owners, liquidity = [], []
+        for positions in self.iter_position_pages(pool_address, max_positions, cache_ttl, first_page):
+            page_owners, page_liquidity = position_columns(positions)
+            owners.append(page_owners)
+            liquidity.append(page_liquidity)
 
-        print(f"  Total positions fetched: {len(all_positions)}")
-        return all_positions
-    
-    def calculate_metrics(self, positions: List[dict], pool_data: dict) -> dict:
-        """Calculate HHI, concentration, and holder metrics"""
-        # Aggregate liquidity by owner
-        owner_liquidity = defaultdict(float)
-        for pos in positions:
-            owner = pos["owner"]
-            liquidity = float(pos["liquidity"])
-            owner_liquidity[owner] += liquidity
-        
-        # Calculate total liquidity and unique holders
-        total_liquidity = sum(owner_liquidity.values())
-        unique_holders = len(owner_liquidity)
-        
-        # Sort owners by liquidity (descending)
-        sorted_owners = sorted(
-            owner_liquidity.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        
-        # Calculate market shares and HHI
-        market_shares = []
-        hhi = 0.0
-        
-        for owner, liquidity in sorted_owners:
-            share_pct = (liquidity / total_liquidity) * 100
-            market_shares.append((owner, liquidity, share_pct))
-            hhi += share_pct ** 2
-        
-        # Top concentrations
-        def get_top_concentration(n: int) -> float:
-            return sum(share for _, _, share in market_shares[:n])
-        
         return {
-            "unique_holders": unique_holders,
-            "total_liquidity": total_liquidity,
-            "hhi": hhi,
-            "top_1": get_top_concentration(1),
-            "top_3": get_top_concentration(3),
-            "top_5": get_top_concentration(5),
-            "top_10": get_top_concentration(10),
-            "top_lps": market_shares[:10],
+            "owners": np.concatenate(owners) if owners else np.empty(0, dtype=object),
+            "liquidity": np.concatenate(liquidity) if liquidity else np.empty(0, dtype=np.float64),
         }
     
-    def analyze_pool(self, pool_address: str) -> dict:
-        """Complete pool analysis with formatted output. Returns dict with all metrics."""
-        print(f"\n{'='*70}")
-        print(f"PancakeSwap V3 Pool Analysis - {self.network.upper()}")
-        print(f"{'='*70}")
-        print(f"Pool Address: {pool_address}\n")
+    def calculate_metrics(self, positions: List[dict], pool_data: dict) -> dict:
+        """Calculate HHI, concentration, and holder metrics"""
+        return self.calculate_metrics_from_arrays(*position_columns(positions))
+
+    def calculate_metrics_from_arrays(self, owners: np.ndarray, liquidity: np.ndarray) -> dict:
+        """Calculate HHI, concentration, and holder metrics from parallel owner / liquidity arrays"""
+        return concentration_metrics(owners, liquidity)
+
+    def analyze_pool(self, pool_address: str, cache_ttl: int = 0) -> dict:
+        """Complete pool analysis with formatted output. Returns dict with all metrics.
+
+        With cache_ttl > 0, subgraph responses up to cache_ttl seconds old are
+        reused (e.g. GRAPH_CACHE_TTL); by default every query hits The Graph.
+        """
+        self._print(f"\n{'='*70}")
+        self._print(f"PancakeSwap V3 Pool Analysis - {self.network.upper()}")
+        self._print(f"{'='*70}")
+        self._print(f"Pool Address: {pool_address}\n")
 
         result = {
             "protocol": "PancakeSwap V3",
@@ -167,11 +317,11 @@ class PancakeSwapV3Analyzer:
         }
 
         # Get pool data
-        print("Fetching pool data...")
-        pool_data = self.get_pool_data(pool_address)
+        self._print("Fetching pool data...")
+        pool_data, first_page = self.get_pool_with_positions(pool_address, cache_ttl=cache_ttl)
 
         if not pool_data:
-            print(f"❌ Pool not found on {self.network}")
+            self._print(f"❌ Pool not found on {self.network}")
             result["error"] = f"Pool not found on {self.network}"
             return result
 
@@ -183,11 +333,11 @@ class PancakeSwapV3Analyzer:
         result["fee_tier"] = int(pool_data['feeTier']) / 10000
         result["tvl_usd"] = float(pool_data['totalValueLockedUSD'])
 
-        print(f"\n📊 POOL INFO")
-        print(f"{'─'*70}")
-        print(f"Pair: {token0['symbol']}/{token1['symbol']}")
-        print(f"Fee Tier: {int(pool_data['feeTier']) / 10000}%")
-        print(f"TVL (USD): ${float(pool_data['totalValueLockedUSD']):,.2f}")
+        self._print(f"\n📊 POOL INFO")
+        self._print(f"{'─'*70}")
+        self._print(f"Pair: {token0['symbol']}/{token1['symbol']}")
+        self._print(f"Fee Tier: {int(pool_data['feeTier']) / 10000}%")
+        self._print(f"TVL (USD): ${float(pool_data['totalValueLockedUSD']):,.2f}")
 
         # Token amounts
         token0_amount = float(pool_data['totalValueLockedToken0'])
@@ -198,23 +348,23 @@ class PancakeSwapV3Analyzer:
             {"symbol": token1['symbol'], "amount": token1_amount}
         ]
 
-        print(f"\n💰 TOKEN AMOUNTS")
-        print(f"{'─'*70}")
-        print(f"{token0['symbol']}: {token0_amount:,.4f}")
-        print(f"{token1['symbol']}: {token1_amount:,.4f}")
+        self._print(f"\n💰 TOKEN AMOUNTS")
+        self._print(f"{'─'*70}")
+        self._print(f"{token0['symbol']}: {token0_amount:,.4f}")
+        self._print(f"{token1['symbol']}: {token1_amount:,.4f}")
 
         # Get positions
-        print(f"\n🔍 Fetching LP positions...")
-        positions = self.get_all_positions(pool_address)
+        self._print(f"\n🔍 Fetching LP positions...")
+        positions = self.get_position_arrays(pool_address, cache_ttl=cache_ttl, first_page=first_page)
 
-        if not positions:
-            print("❌ No active positions found")
+        if not len(positions["owners"]):
+            self._print("❌ No active positions found")
             result["error"] = "No active positions found"
             return result
 
         # Calculate metrics
-        print("\n📈 Calculating metrics...")
-        metrics = self.calculate_metrics(positions, pool_data)
+        self._print("\n📈 Calculating metrics...")
+        metrics = self.calculate_metrics_from_arrays(positions["owners"], positions["liquidity"])
 
         # HHI interpretation
         if metrics['hhi'] < 1500:
@@ -240,29 +390,29 @@ class PancakeSwapV3Analyzer:
         ]
 
         # Display concentration metrics
-        print(f"\n🎯 CONCENTRATION METRICS")
-        print(f"{'─'*70}")
-        print(f"Unique Holders: {metrics['unique_holders']:,}")
-        print(f"HHI (0-10,000): {metrics['hhi']:,.2f}")
-        print(f"HHI Category: {hhi_label}")
-
-        print(f"\n📊 LP CONCENTRATION")
-        print(f"{'─'*70}")
-        print(f"Top 1 LP:   {metrics['top_1']:.2f}%")
-        print(f"Top 3 LPs:  {metrics['top_3']:.2f}%")
-        print(f"Top 5 LPs:  {metrics['top_5']:.2f}%")
-        print(f"Top 10 LPs: {metrics['top_10']:.2f}%")
+        self._print(f"\n🎯 CONCENTRATION METRICS")
+        self._print(f"{'─'*70}")
+        self._print(f"Unique Holders: {metrics['unique_holders']:,}")
+        self._print(f"HHI (0-10,000): {metrics['hhi']:,.2f}")
+        self._print(f"HHI Category: {hhi_label}")
+
+        self._print(f"\n📊 LP CONCENTRATION")
+        self._print(f"{'─'*70}")
+        self._print(f"Top 1 LP:   {metrics['top_1']:.2f}%")
+        self._print(f"Top 3 LPs:  {metrics['top_3']:.2f}%")
+        self._print(f"Top 5 LPs:  {metrics['top_5']:.2f}%")
+        self._print(f"Top 10 LPs: {metrics['top_10']:.2f}%")
 
         # Display top LPs
-        print(f"\n🏆 TOP 10 LIQUIDITY PROVIDERS")
-        print(f"{'─'*70}")
-        print(f"{'Rank':<6} {'Address':<44} {'Share %':>10}")
-        print(f"{'─'*70}")
+        self._print(f"\n🏆 TOP 10 LIQUIDITY PROVIDERS")
+        self._print(f"{'─'*70}")
+        self._print(f"{'Rank':<6} {'Address':<44} {'Share %':>10}")
+        self._print(f"{'─'*70}")
 
         for i, (owner, liquidity, share) in enumerate(metrics['top_lps'], 1):
-            print(f"{i:<6} {owner:<44} {share:>9.2f}%")
+            self._print(f"{i:<6} {owner:<44} {share:>9.2f}%")
 
-        print(f"\n{'='*70}\n")
+        self._print(f"\n{'='*70}\n")
 
         result["status"] = "success"
         return result
@@ -1,13 +1,97 @@
+import hashlib
+import os
+import time
 import requests
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def get_coingecko_data(coin_id, days=365):
+from disk_cache import cache_path, read_json, valid_fetched_at, write_json
+
+# CoinGecko responses are cached in the per-user cache directory (one file
+# per request) and, once older than cache_ttl, revalidated with ETag /
+# Last-Modified
+COINGECKO_CACHE_DIR = cache_path("coingecko")
+COINGECKO_CACHE_TTL = 3600
+
+@lru_cache(maxsize=None)
+def _get_session():
+    """Return the keep-alive session shared by every CoinGecko request."""
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            raise_on_status=False
+        )
+    ))
+    return session
+
+def _read_cached_response(path):
+    """Load a cache entry, or None unless it has a valid fetched_at and dict data."""
+    entry = read_json(path)
+    if not valid_fetched_at(entry) or not isinstance(entry.get("data"), dict):
+        return None
+    for header in ("etag", "last_modified"):
+        if not isinstance(entry.get(header), str):
+            entry[header] = None
+    return entry
+
+def _get_cached_json(url, params, cache_ttl):
+    """GET url as JSON through the disk cache.
+
+    Entries younger than cache_ttl are returned as is; older ones are
+    revalidated with a conditional request (a 304 just refreshes them). A
+    cached entry is also returned, stale, if the request fails.
+    """
+    key = hashlib.blake2b(f"{url}?{sorted(params.items())}".encode(), digest_size=16).hexdigest()
+    path = os.path.join(COINGECKO_CACHE_DIR, f"{key}.json")
+    cached = _read_cached_response(path)
+    if cached and time.time() - cached["fetched_at"] < cache_ttl:
+        return cached["data"]
+
+    headers = {}
+    if cached and cached.get("etag"):
+        headers["If-None-Match"] = cached["etag"]
+    if cached and cached.get("last_modified"):
+        headers["If-Modified-Since"] = cached["last_modified"]
+
+    try:
+        response = _get_session().get(url, params=params, headers=headers, timeout=30)
+    except requests.RequestException:
+        if cached:
+            return cached["data"]
+        raise
+
+    if response.status_code == 304 and cached:
+        cached["fetched_at"] = time.time()
+    elif response.status_code == 200:
+        cached = {
+            "fetched_at": time.time(),
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "data": response.json(),
+        }
+    elif cached:
+        return cached["data"]
+    else:
+        return response.json()
+
+    write_json(path, cached)
+    return cached["data"]
+
+def get_coingecko_data(coin_id, days=365, cache_ttl=0):
     url = f"https://api.coingecko.com/api/v3/coins/{coin_id}/market_chart"
     params = {'vs_currency': 'usd', 'days': days}
-    response = requests.get(url, params=params)
-    data = response.json()
+    if cache_ttl > 0:
+        data = _get_cached_json(url, params, cache_ttl)
+    else:
+        response = _get_session().get(url, params=params, timeout=30)
+        data = response.json()
     prices = [item[1] for item in data['prices']]
     timestamps = [item[0] for item in data['prices']]
     return timestamps, prices
@@ -27,20 +111,33 @@ def calculate_peg_deviation(token_prices, underlying_prices):
         'Current Deviation': f"{deviation[-1]:.4f}%"
     }
 
+def _percentile_sorted(sorted_values, q):
+    """np.percentile (linear interpolation) on an already sorted, finite array."""
+    position = q / 100 * (sorted_values.size - 1)
+    lower = int(position)
+    upper = min(lower + 1, sorted_values.size - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
 def calculate_metrics(prices):
     prices = np.array(prices)
     returns = np.diff(prices) / prices[:-1]
+    # Gaps and zero prices give NaN / inf returns, which would sort to the
+    # ends and corrupt the percentile and CVaR reads below; drop them
+    returns = returns[np.isfinite(returns)]
     
     # Annualized Volatility
     volatility = np.std(returns) * np.sqrt(365)
     
+    # Sort once; both VaR levels and both CVaR tails are read from it
+    sorted_returns = np.sort(returns)
+    
     # VaR (Value at Risk)
-    var_95 = np.percentile(returns, 5)
-    var_99 = np.percentile(returns, 1)
+    var_95 = _percentile_sorted(sorted_returns, 5)
+    var_99 = _percentile_sorted(sorted_returns, 1)
     
-    # CVaR (Conditional Value at Risk)
-    cvar_95 = returns[returns <= var_95].mean()
-    cvar_99 = returns[returns <= var_99].mean()
+    # CVaR (Conditional Value at Risk): mean of the returns at or below VaR
+    cvar_95 = sorted_returns[:np.searchsorted(sorted_returns, var_95, side='right')].mean()
+    cvar_99 = sorted_returns[:np.searchsorted(sorted_returns, var_99, side='right')].mean()
     
     return {
         'Annualized Volatility': f"{volatility:.2%}",
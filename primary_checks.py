@@ -8,7 +8,7 @@ Primary checks are binary (yes/no) and represent fundamental requirements
 that cannot be compensated by good scores in other areas.
 """
 
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, Callable, Iterable, Iterator, List, Tuple
 from dataclasses import dataclass
 from enum import Enum
 
@@ -19,7 +19,7 @@ class CheckStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckResult:
     """Result of a single primary check."""
     check_id: str
@@ -60,9 +60,10 @@ PRIMARY_CHECKS = {
 # CHECK FUNCTIONS
 # =============================================================================
 
-def check_has_security_audit(metrics: dict) -> CheckResult:
+def check_has_security_audit(metrics: dict, check_def: dict = None) -> CheckResult:
     """Check if at least one security audit exists."""
-    check_def = PRIMARY_CHECKS["has_security_audit"]
+    if check_def is None:
+        check_def = PRIMARY_CHECKS["has_security_audit"]
 
     audit_data = metrics.get("audit_data")
     has_audit = audit_data is not None and bool(audit_data)
@@ -101,49 +102,53 @@ def _get_unresolved_critical(audit: dict) -> int:
     return 0
 
 
-def check_no_critical_audit_issues(metrics: dict) -> CheckResult:
+def _iter_unresolved_critical(audit_data: dict) -> Iterator[int]:
+    """Yield the unresolved critical count of every audit entry in audit_data."""
+    # Direct issues/unresolved field (simple format)
+    yield _get_unresolved_critical(audit_data)
+
+    # Nested audit arrays (complex format)
+    for key in ("key_audits", "wsteth_specific_audits", "wbtc_specific_audits"):
+        audit_array = audit_data.get(key, [])
+        if isinstance(audit_array, list):
+            for audit in audit_array:
+                if isinstance(audit, dict):
+                    yield _get_unresolved_critical(audit)
+
+    # latest_protocol_audit
+    latest = audit_data.get("latest_protocol_audit", {})
+    if isinstance(latest, dict):
+        yield _get_unresolved_critical(latest)
+
+
+def check_no_critical_audit_issues(metrics: dict, check_def: dict = None) -> CheckResult:
     """Check if there are no unresolved critical audit issues."""
-    check_def = PRIMARY_CHECKS["no_critical_audit_issues"]
+    if check_def is None:
+        check_def = PRIMARY_CHECKS["no_critical_audit_issues"]
 
     audit_data = metrics.get("audit_data", {})
-    critical_issues = 0
 
+    # Stop at the first audit with unresolved criticals; one is enough to fail
+    first_critical = 0
     if audit_data:
-        # Check for direct issues/unresolved field (simple format)
-        critical_issues += _get_unresolved_critical(audit_data)
-
-        # Check for issues in nested audit arrays (complex format)
-        audit_arrays = [
-            audit_data.get("key_audits", []),
-            audit_data.get("wsteth_specific_audits", []),
-            audit_data.get("wbtc_specific_audits", []),
-        ]
-        for audit_array in audit_arrays:
-            if isinstance(audit_array, list):
-                for audit in audit_array:
-                    if isinstance(audit, dict):
-                        critical_issues += _get_unresolved_critical(audit)
-
-        # Check latest_protocol_audit
-        latest = audit_data.get("latest_protocol_audit", {})
-        if isinstance(latest, dict):
-            critical_issues += _get_unresolved_critical(latest)
-
-    passes = critical_issues == 0
+        first_critical = next((count for count in _iter_unresolved_critical(audit_data) if count > 0), 0)
+
+    passes = first_critical == 0
 
     return CheckResult(
         check_id="no_critical_audit_issues",
         name=check_def["name"],
         status=CheckStatus.PASS if passes else CheckStatus.FAIL,
         condition=check_def["condition"],
-        actual_value=f"{critical_issues} critical issues",
+        actual_value="0 critical issues" if passes else f"{first_critical}+ critical issues",
         reason="No critical issues" if passes else check_def["disqualify_reason"],
     )
 
 
-def check_no_active_incident(metrics: dict) -> CheckResult:
+def check_no_active_incident(metrics: dict, check_def: dict = None) -> CheckResult:
     """Check if there are no active/recent security incidents."""
-    check_def = PRIMARY_CHECKS["no_active_incident"]
+    if check_def is None:
+        check_def = PRIMARY_CHECKS["no_active_incident"]
 
     incidents = metrics.get("incidents", [])
 
@@ -165,6 +170,17 @@ def check_no_active_incident(metrics: dict) -> CheckResult:
     )
 
 
+# Check IDs paired with their functions and definitions, in evaluation order
+_CHECKS: Tuple[Tuple[str, Callable[[dict, dict], CheckResult], dict], ...] = tuple(
+    (check_id, check_fn, PRIMARY_CHECKS[check_id])
+    for check_id, check_fn in (
+        ("has_security_audit", check_has_security_audit),
+        ("no_critical_audit_issues", check_no_critical_audit_issues),
+        ("no_active_incident", check_no_active_incident),
+    )
+)
+
+
 # =============================================================================
 # MAIN EVALUATION FUNCTION
 # =============================================================================
@@ -183,22 +199,66 @@ def run_primary_checks(metrics: dict) -> Dict[str, Any]:
         - failed_checks: List of failed check IDs
         - summary: Human-readable summary
     """
-    check_functions = [
-        check_has_security_audit,
-        check_no_critical_audit_issues,
-        check_no_active_incident,
-    ]
+    fail = CheckStatus.FAIL
+    results: List[CheckResult] = []
+    failed_checks: List[str] = []
+
+    for _, check_fn, check_def in _CHECKS:
+        result = check_fn(metrics, check_def)
+        results.append(result)
+
+        if result.status is fail:
+            failed_checks.append(result.check_id)
+
+    return _build_report(results, failed_checks)
+
+
+def run_primary_checks_batch(all_metrics: Iterable[dict]) -> List[Dict[str, Any]]:
+    """
+    Run the primary checks on many assets, stopping at each asset's first failure.
+
+    Once a check fails the asset is disqualified, so the remaining checks are
+    not evaluated and are reported as UNKNOWN. Qualified assets get exactly
+    the same result as run_primary_checks.
+
+    Args:
+        all_metrics: Iterable of metrics dictionaries, one per asset
+
+    Returns:
+        List of run_primary_checks-style dictionaries, in input order
+    """
+    return [_run_checks_until_failure(metrics) for metrics in all_metrics]
 
+
+def _run_checks_until_failure(metrics: dict) -> Dict[str, Any]:
+    """Run the primary checks in order, skipping the rest after the first failure."""
+    unknown = CheckStatus.UNKNOWN
     results: List[CheckResult] = []
     failed_checks: List[str] = []
 
-    for check_fn in check_functions:
-        result = check_fn(metrics)
+    for check_id, check_fn, check_def in _CHECKS:
+        if failed_checks:
+            results.append(CheckResult(
+                check_id=check_id,
+                name=check_def["name"],
+                status=unknown,
+                condition=check_def["condition"],
+                actual_value=None,
+                reason="Not evaluated - asset already disqualified",
+            ))
+            continue
+
+        result = check_fn(metrics, check_def)
         results.append(result)
 
-        if result.status == CheckStatus.FAIL:
+        if result.status is CheckStatus.FAIL:
             failed_checks.append(result.check_id)
 
+    return _build_report(results, failed_checks)
+
+
+def _build_report(results: List[CheckResult], failed_checks: List[str]) -> Dict[str, Any]:
+    """Assemble the qualification report for one asset."""
     qualified = len(failed_checks) == 0
 
     # Build summary
@@ -211,7 +271,7 @@ def run_primary_checks(metrics: dict) -> Dict[str, Any]:
         "qualified": qualified,
         "checks": results,
         "failed_checks": failed_checks,
-        "passed_count": len(results) - len(failed_checks),
+        "passed_count": sum(1 for result in results if result.status is CheckStatus.PASS),
         "total_count": len(results),
         "summary": summary,
     }
@@ -1,7 +1,20 @@
 from web3 import Web3
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import copy
 import json
-import numpy as np
+import logging
+import threading
+import time
+from statistics import median
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from disk_cache import cache_path, read_json, write_json
+from rpc_hedge import RPC_HEDGE_DELAY, hedged_call
+
+logger = logging.getLogger(__name__)
 
 # =============================================================================
 # ABIs
@@ -31,18 +44,79 @@ WSTETH_ABI = json.loads('''[
     {"inputs":[{"internalType":"uint256","name":"_wstETHAmount","type":"uint256"}],"name":"getStETHByWstETH","outputs":[{"internalType":"uint256","name":"","type":"uint256"}],"stateMutability":"view","type":"function"}
 ]''')
 
+# Multicall3 ABI (aggregate3 + getBlockNumber/getChainId), for batching reads into a single eth_call
+MULTICALL3_ABI = json.loads('[{"inputs":[],"name":"getChainId","outputs":[{"internalType":"uint256","name":"chainid","type":"uint256"}],"stateMutability":"view","type":"function"},{"inputs":[],"name":"getBlockNumber","outputs":[{"internalType":"uint256","name":"blockNumber","type":"uint256"}],"stateMutability":"view","type":"function"},{"inputs":[{"components":[{"internalType":"address","name":"target","type":"address"},{"internalType":"bool","name":"allowFailure","type":"bool"},{"internalType":"bytes","name":"callData","type":"bytes"}],"internalType":"struct Multicall3.Call3[]","name":"calls","type":"tuple[]"}],"name":"aggregate3","outputs":[{"components":[{"internalType":"bool","name":"success","type":"bool"},{"internalType":"bytes","name":"returnData","type":"bytes"}],"internalType":"struct Multicall3.Result[]","name":"returnData","type":"tuple[]"}],"stateMutability":"payable","type":"function"}]')
+
 # =============================================================================
 # RPC Configuration
 # =============================================================================
 
+# A chain may list several RPC URLs (here and in rpc_urls); reads go to the
+# first one and only hedge to the next if it fails or is slower than
+# RPC_HEDGE_DELAY, so healthy endpoints see a single request per read
 RPCS = {
-    "ethereum": "https://eth.drpc.org",
-    "base": "https://base.drpc.org",
-    "arbitrum": "https://arbitrum.drpc.org",
-    "optimism": "https://optimism.drpc.org",
-    "polygon": "https://polygon.drpc.org"
+    "ethereum": ["https://eth.drpc.org", "https://ethereum-rpc.publicnode.com"],
+    "base": ["https://base.drpc.org", "https://base-rpc.publicnode.com"],
+    "arbitrum": ["https://arbitrum.drpc.org", "https://arbitrum-one-rpc.publicnode.com"],
+    "optimism": ["https://optimism.drpc.org", "https://optimism-rpc.publicnode.com"],
+    "polygon": ["https://polygon.drpc.org", "https://polygon-bor-rpc.publicnode.com"]
 }
 
+# (connect, read) timeout in seconds for RPC requests, so a dead endpoint
+# fails fast instead of holding a chain for web3's 30s default
+RPC_TIMEOUT = (5, 10)
+
+# ABIs by name, so contract instances can be memoized on hashable keys
+ABIS = {
+    "chainlink": CHAINLINK_ABI,
+    "token": TOKEN_ABI,
+    "lido": LIDO_ABI,
+    "wsteth": WSTETH_ABI,
+    "multicall3": MULTICALL3_ABI,
+}
+
+# Multicall3 is deployed at the same address on every supported chain
+MULTICALL3 = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+# Pre-encoded calldata and output types of every zero-argument read in ABIS,
+# so multicall() does not rebuild them through the contract machinery per call
+# (a name shared between ABIs, e.g. decimals, has the same signature in each)
+READ_CALLS = {
+    fn["name"]: (Web3.keccak(text=f"{fn['name']}()")[:4], [output["type"] for output in fn["outputs"]])
+    for abi in ABIS.values()
+    for fn in abi
+    if fn["type"] == "function" and not fn["inputs"]
+}
+AGGREGATE3_SELECTOR = Web3.keccak(text="aggregate3((address,bool,bytes)[])")[:4]
+
+# PoR feeds update every few hours and Lido's pooled ether once a day, so
+# callers may reuse a result for a few minutes (see analyze_proof_of_reserve)
+POR_CACHE_TTL = 300
+
+# Token / feed decimals never change, so they are learned once and kept in a
+# per-user cache file as {"chain_id:address": decimals} (see _get_decimals_cache)
+POR_DECIMALS_PATH = cache_path("por_decimals.json")
+_decimals_lock = threading.Lock()
+
+# decimals() values outside 0..MAX_DECIMALS are rejected as corrupt
+MAX_DECIMALS = 36
+
+# Chain ids of the chains in RPCS, so cached decimals can be looked up before
+# an RPC has reported its chain id (getChainId rides along in every read)
+CHAIN_IDS = {
+    "ethereum": 1,
+    "base": 8453,
+    "arbitrum": 42161,
+    "optimism": 10,
+    "polygon": 137
+}
+
+# RPC URL -> chain id it reported on its last read
+_rpc_chain_ids = {}
+
+# Successful analyze_proof_of_reserve results: key -> (timestamp, result)
+_por_cache = {}
+
 HELIUS_KEY = "5167631c-772f-49bb-ab19-fe8553e4e6dc"
 
 # =============================================================================
@@ -64,40 +138,221 @@ LIQUID_STAKING_CONTRACTS = {
 # Helper Functions
 # =============================================================================
 
-def get_web3(chain: str, rpc_urls: dict = None) -> Web3:
-    """Get Web3 instance for a chain."""
+@lru_cache(maxsize=None)
+def _get_session() -> requests.Session:
+    """Return the keep-alive HTTP session shared by the EVM RPCs and Helius."""
+    session = requests.Session()
+    # Every RPC call is a read-only POST, so rate limits and gateway errors
+    # are safe to retry quickly
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=64,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.1,
+            status_forcelist=[429, 502, 503, 504],
+            allowed_methods=["POST"],
+            raise_on_status=False
+        )
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_rpc_urls(chain: str, rpc_urls: dict = None) -> list:
+    """Get the list of RPC URLs for a chain (custom rpc_urls take precedence)."""
     if rpc_urls and chain in rpc_urls:
-        rpc_url = rpc_urls[chain]
+        urls = rpc_urls[chain]
     else:
-        rpc_url = RPCS.get(chain)
+        urls = RPCS.get(chain)
 
-    if not rpc_url:
+    if not urls:
         raise ValueError(f"No RPC URL for chain: {chain}")
 
-    return Web3(Web3.HTTPProvider(rpc_url))
+    return [urls] if isinstance(urls, str) else list(urls)
+
+
+def get_web3(chain: str, rpc_urls: dict = None) -> Web3:
+    """Get Web3 instance for a chain (its primary RPC URL)."""
+    return _get_w3(get_rpc_urls(chain, rpc_urls)[0])
+
+
+def call_first_rpc(chain: str, rpc_urls: dict, fn):
+    """
+    Run fn(w3) against the RPC URLs of a chain in order and return the first success.
+
+    The next URL is only tried once the requests in flight have failed or
+    taken longer than RPC_HEDGE_DELAY (see rpc_hedge.hedged_call). If every
+    endpoint fails, the last error is raised.
+    """
+    return hedged_call(lambda url: fn(_get_w3(url)), get_rpc_urls(chain, rpc_urls), RPC_HEDGE_DELAY)
+
+
+@lru_cache(maxsize=32)
+def _get_w3(rpc_url: str) -> Web3:
+    """Return a Web3 instance per RPC URL, built once and reused (which also keeps get_contract's cache warm)."""
+    w3 = Web3(Web3.HTTPProvider(rpc_url, request_kwargs={"timeout": RPC_TIMEOUT}, session=_get_session()))
+    # The validation middleware checks transaction chain ids, costing two
+    # eth_chainId round-trips before every eth_call; this module only reads
+    w3.middleware_onion.remove("validation")
+    return w3
+
+
+def _valid_decimals(decimals) -> bool:
+    return isinstance(decimals, int) and not isinstance(decimals, bool) and 0 <= decimals <= MAX_DECIMALS
+
+
+@lru_cache(maxsize=None)
+def _get_decimals_cache() -> dict:
+    """Return the (chain_id, address) -> decimals cache, seeded from POR_DECIMALS_PATH.
+
+    Malformed entries and out-of-range decimals in the file are ignored.
+    """
+    saved = read_json(POR_DECIMALS_PATH)
+
+    cache = {}
+    if isinstance(saved, dict):
+        for key, decimals in saved.items():
+            chain_id, _, address = key.partition(":")
+            if chain_id.isdigit() and address and _valid_decimals(decimals):
+                cache[(int(chain_id), address.lower())] = decimals
+    return cache
+
+
+def _save_decimals(learned: dict):
+    """Add newly read decimals to the cache and rewrite POR_DECIMALS_PATH atomically."""
+    cache = _get_decimals_cache()
+    with _decimals_lock:
+        cache.update(learned)
+        write_json(POR_DECIMALS_PATH, {f"{chain_id}:{address}": decimals for (chain_id, address), decimals in cache.items()})
+
+
+@lru_cache(maxsize=128)
+def _checksum(address: str) -> str:
+    """Memoized Web3.to_checksum_address, so repeated runs reuse canonical addresses."""
+    return Web3.to_checksum_address(address)
+
+
+@lru_cache(maxsize=128)
+def get_contract(w3, address: str, abi_name: str):
+    """Get a (memoized) contract instance for an address and one of the ABIS."""
+    return w3.eth.contract(address=address, abi=ABIS[abi_name])
+
+
+def multicall(w3, calls: list, allow_failure: bool = False, block_identifier="latest") -> list:
+    """
+    Run several zero-argument view calls in a single eth_call via Multicall3.
+
+    By default calls are not allowed to fail individually, so a revert in
+    any of them raises just like the equivalent sequential .call() would.
+
+    Args:
+        w3: Web3 instance
+        calls: List of (contract, function_name) tuples
+        allow_failure: Return None for calls that revert instead of raising
+        block_identifier: Block to read at (default: latest)
+
+    Returns:
+        List of decoded return values aligned with calls (single outputs unwrapped)
+    """
+    payload = w3.codec.encode(["(address,bool,bytes)[]"], [[
+        (contract.address, allow_failure, READ_CALLS[function_name][0])
+        for contract, function_name in calls
+    ]])
+    raw = w3.eth.call({"to": MULTICALL3, "data": AGGREGATE3_SELECTOR + payload}, block_identifier)
+    responses = w3.codec.decode(["(bool,bytes)[]"], raw)[0]
+
+    results = []
+    for (_, function_name), (success, return_data) in zip(calls, responses):
+        if not success or not return_data:
+            results.append(None)
+            continue
+        values = w3.codec.decode(READ_CALLS[function_name][1], return_data)
+        results.append(values[0] if len(values) == 1 else values)
+    return results
 
 
 def get_reserves(w3, por_address):
-    """Get reserves from Chainlink PoR feed."""
-    contract = w3.eth.contract(address=por_address, abi=CHAINLINK_ABI)
-    round_data = contract.functions.latestRoundData().call()
-    decimals = contract.functions.decimals().call()
-    reserves = round_data[1] / (10 ** decimals)
-    return reserves
+    """Get reserves from Chainlink PoR feed (decimals cached, see get_reserves_and_supply)."""
+    return get_reserves_and_supply(w3, por_address=por_address)[0]
 
 
 def get_evm_supply(w3, token_address):
-    """Get ERC20 token total supply."""
-    contract = w3.eth.contract(address=token_address, abi=TOKEN_ABI)
-    supply = contract.functions.totalSupply().call()
-    decimals = contract.functions.decimals().call()
-    return supply / (10 ** decimals)
+    """Get ERC20 token total supply (decimals cached, see get_reserves_and_supply)."""
+    return get_reserves_and_supply(w3, token_address=token_address)[1]
+
+
+def get_reserves_and_supply(
+    w3,
+    chain: str = None,
+    por_address: str = None,
+    token_address: str = None,
+    block_identifier="latest"
+) -> tuple:
+    """
+    Get PoR reserves and token supply for one chain in a single round-trip.
+
+    Both are read in the same eth_call, so they always come from the same
+    block, whose number is returned alongside them. Pass block_identifier to
+    re-read an earlier snapshot.
+
+    Either address may be omitted; its value is then returned as None.
+    decimals() is only requested the first time an address is seen on a
+    chain id (see _get_decimals_cache). Cached values are looked up under the
+    chain id the RPC reported before (or CHAIN_IDS[chain]); the RPC's actual
+    chain id is read in the same aggregate, and on a mismatch the call is
+    repeated with that chain id.
+
+    Returns:
+        (reserves, supply, block_number) tuple
+    """
+    rpc_url = w3.provider.endpoint_uri
+    chain_id = _rpc_chain_ids.get(rpc_url) or CHAIN_IDS.get(chain)
+
+    multicall3 = get_contract(w3, MULTICALL3, "multicall3")
+    calls = [(multicall3, "getBlockNumber"), (multicall3, "getChainId")]
+    if por_address:
+        calls.append((get_contract(w3, por_address, "chainlink"), "latestRoundData"))
+    if token_address:
+        calls.append((get_contract(w3, token_address, "token"), "totalSupply"))
+
+    decimals_cache = _get_decimals_cache()
+    addresses = [address for address in (por_address, token_address) if address]
+    missing = [address for address in addresses if (chain_id, address.lower()) not in decimals_cache]
+    calls += [(get_contract(w3, address, "token"), "decimals") for address in missing]
+
+    values = multicall(w3, calls, block_identifier=block_identifier)
+    block_number, rpc_chain_id = values[:2]
+    _rpc_chain_ids[rpc_url] = rpc_chain_id
+    if rpc_chain_id != chain_id and len(missing) < len(addresses):
+        # Cached decimals were for another chain; read again under the real one
+        return get_reserves_and_supply(w3, chain, por_address, token_address, block_identifier)
+
+    learned = dict(zip(missing, values[len(values) - len(missing):]))
+    for address, decimals in learned.items():
+        if not _valid_decimals(decimals):
+            raise ValueError(f"Invalid decimals() {decimals} from {address}")
+    if learned:
+        _save_decimals({(rpc_chain_id, address.lower()): decimals for address, decimals in learned.items()})
+
+    def scale(address):
+        decimals = learned[address] if address in learned else decimals_cache[(rpc_chain_id, address.lower())]
+        return 10 ** decimals
+
+    reserves = supply = None
+    values = iter(values[2:])
+    if por_address:
+        reserves = next(values)[1] / scale(por_address)
+    if token_address:
+        supply = next(values) / scale(token_address)
+    return reserves, supply, block_number
 
 
 def get_solana_supply(token_address):
     """Get Solana token total supply."""
     try:
-        r = requests.post(
+        r = _get_session().post(
             f"https://mainnet.helius-rpc.com/?api-key={HELIUS_KEY}",
             json={
                 "jsonrpc": "2.0",
@@ -114,7 +369,7 @@ def get_solana_supply(token_address):
         decimals = int(value.get('decimals', 8))
         return amount / (10 ** decimals)
     except Exception as e:
-        print(f"Error fetching Solana supply: {e}")
+        logger.warning("Error fetching Solana supply: %s", e)
         return 0
 
 
@@ -138,10 +393,66 @@ def calculate_reserve_ratio(reserves, total_supply):
     }
 
 
+def calculate_reserve_ratios_batch(reserves, total_supplies) -> dict:
+    """
+    Vectorized calculate_reserve_ratio for scoring many assets at once.
+
+    Args:
+        reserves: Sequence / array of reserves, one per asset
+        total_supplies: Sequence / array of total supplies, aligned with reserves
+
+    Returns:
+        dict with the same keys as calculate_reserve_ratio, each an array
+    """
+    # Imported here so single-asset PoR checks don't pay for numpy at import
+    import numpy as np
+
+    reserves = np.asarray(reserves, dtype=np.float64)
+    total_supplies = np.asarray(total_supplies, dtype=np.float64)
+
+    ratio = np.divide(reserves, total_supplies, out=np.zeros_like(reserves), where=total_supplies > 0)
+    score = np.where(
+        ratio >= 1.0,
+        95 + np.minimum(5, (ratio - 1.0) * 100),
+        np.maximum(0, 95 - (1.0 - ratio) * 500)
+    )
+
+    return {
+        "reserves": reserves,
+        "total_supply": total_supplies,
+        "reserve_ratio": ratio,
+        "reserve_ratio_pct": ratio * 100,
+        "surplus_deficit": reserves - total_supplies,
+        "is_fully_backed": reserves >= total_supplies,
+        "score": score
+    }
+
+
 # =============================================================================
 # Chainlink Proof of Reserve (for wrapped assets like cbBTC)
 # =============================================================================
 
+def _fetch_chain_por(chain: dict, rpc_urls: dict = None) -> dict:
+    """Read PoR reserves and token supply for one evm_chains entry (errors are recorded, not raised)."""
+    chain_result = {"name": chain["name"], "por_address": chain.get("por"), "token_address": chain.get("token")}
+
+    try:
+        reserves, supply, block_number = call_first_rpc(chain["name"], rpc_urls, lambda w3: get_reserves_and_supply(
+            w3, chain["name"], chain.get("por"), chain.get("token"), chain.get("block", "latest")
+        ))
+        chain_result["block_number"] = block_number
+
+        if chain.get("por"):
+            chain_result["reserves"] = reserves
+        if chain.get("token"):
+            chain_result["supply"] = supply
+
+    except Exception as e:
+        chain_result["error"] = str(e)
+
+    return chain_result
+
+
 def analyze_chainlink_por(
     evm_chains: list = None,
     solana_token: str = None,
@@ -155,6 +466,7 @@ def analyze_chainlink_por(
 
     Args:
         evm_chains: List of dicts with keys: name, por (PoR address), token (token address)
+                    and optionally block (block number to read at, default: latest)
         solana_token: Optional Solana token address
         rpc_urls: Optional custom RPC URLs
         por_scope: "global" = PoR covers all chains (compare median PoR vs total supply)
@@ -181,74 +493,69 @@ def analyze_chainlink_por(
     total_supply = 0
     supply_from_por_chains = 0  # Track supply only from chains that have PoR
 
+    # Chains hit independent RPCs, so every chain (and Solana) is read at once;
+    # results are then combined in input order
+    with ThreadPoolExecutor(max_workers=len(evm_chains) + 1) as executor:
+        solana_future = executor.submit(get_solana_supply, solana_token) if solana_token else None
+        chain_results = list(executor.map(lambda chain: _fetch_chain_por(chain, rpc_urls), evm_chains))
+
     # Collect reserves from each PoR feed
-    for chain in evm_chains:
-        chain_result = {"name": chain["name"], "por_address": chain.get("por"), "token_address": chain.get("token")}
+    for chain, chain_result in zip(evm_chains, chain_results):
         has_por = bool(chain.get("por"))
 
-        try:
-            w3 = get_web3(chain["name"], rpc_urls)
-
-            if has_por:
-                reserves = get_reserves(w3, chain["por"])
-                reserve_values.append(reserves)
-                chain_result["reserves"] = reserves
-                print(f"\n{chain['name'].upper()} Reserves: {reserves:.8f}")
+        if "error" in chain_result:
+            logger.warning("Error on %s: %s", chain["name"], chain_result["error"])
 
-            if chain.get("token"):
-                supply = get_evm_supply(w3, chain["token"])
-                total_supply += supply
-                chain_result["supply"] = supply
-                print(f"{chain['name'].upper()} Supply: {supply:.8f}")
+        elif has_por:
+            reserve_values.append(chain_result["reserves"])
+            logger.debug("\n%s Reserves: %.8f", chain["name"].upper(), chain_result["reserves"])
 
-                # Track supply from chains with PoR for per_chain scope
-                if has_por:
-                    supply_from_por_chains += supply
+        if "supply" in chain_result:
+            total_supply += chain_result["supply"]
+            logger.debug("%s Supply: %.8f", chain["name"].upper(), chain_result["supply"])
 
-        except Exception as e:
-            chain_result["error"] = str(e)
-            print(f"Error on {chain['name']}: {e}")
+            # Track supply from chains with PoR for per_chain scope
+            if has_por:
+                supply_from_por_chains += chain_result["supply"]
 
         result["chain_data"].append(chain_result)
 
     # Add Solana supply (only for global scope, as Solana has no PoR feed)
-    if solana_token:
+    if solana_future:
         try:
-            solana_supply = get_solana_supply(solana_token)
+            solana_supply = solana_future.result()
             total_supply += solana_supply
             result["supply"]["solana"] = solana_supply
-            print(f"SOLANA Supply: {solana_supply:.8f}")
+            logger.debug("SOLANA Supply: %.8f", solana_supply)
         except Exception as e:
             result["supply"]["solana_error"] = str(e)
 
     # Take median of reserves
-    median_reserves = np.median(reserve_values) if reserve_values else 0
+    median_reserves = median(reserve_values) if reserve_values else 0
     result["reserves"]["median"] = median_reserves
     result["reserves"]["all_values"] = reserve_values
-    print(f"\nMedian Reserves: {median_reserves:.8f}")
+    logger.debug("\nMedian Reserves: %.8f", median_reserves)
 
     # Determine effective supply based on por_scope
     if por_scope == "per_chain":
         effective_supply = supply_from_por_chains
-        print(f"PoR Scope: per_chain - using supply from chains with PoR only: {effective_supply:.8f}")
+        logger.debug("PoR Scope: per_chain - using supply from chains with PoR only: %.8f", effective_supply)
     else:
         effective_supply = total_supply
-        print(f"PoR Scope: global - using total supply from all chains: {effective_supply:.8f}")
+        logger.debug("PoR Scope: global - using total supply from all chains: %.8f", effective_supply)
 
     result["supply"]["effective"] = effective_supply
     result["supply"]["total"] = total_supply
     result["supply"]["from_por_chains"] = supply_from_por_chains
 
     # Calculate metrics
-    print("\n" + "="*50)
     metrics = calculate_reserve_ratio(median_reserves, effective_supply)
     result["metrics"] = metrics
 
-    for key, value in metrics.items():
-        if isinstance(value, float):
-            print(f"{key}: {value:.8f}")
-        else:
-            print(f"{key}: {value}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("\n" + "="*50)
+        for key, value in metrics.items():
+            logger.debug("%s: %.8f" if isinstance(value, float) else "%s: %s", key, value)
 
     result["status"] = "success"
     return result
@@ -289,7 +596,8 @@ def analyze_lido_reserve(
     try:
         w3 = get_web3(chain, rpc_urls)
 
-        # Get contract addresses
+        # Get contract addresses (config overrides may be in any case, the
+        # built-in ones are stored checksummed)
         if contracts:
             steth_address = contracts.get("steth") or contracts.get("staking_contract")
             wsteth_address = contracts.get("wsteth") or contracts.get("wrapped_token")
@@ -302,23 +610,34 @@ def analyze_lido_reserve(
             raise ValueError(f"No Lido stETH contract found for chain: {chain}")
 
         # Initialize contracts
-        steth_contract = w3.eth.contract(
-            address=Web3.to_checksum_address(steth_address),
-            abi=LIDO_ABI
-        )
-
-        print(f"\n{'='*60}")
-        print(f"LIDO RESERVE VERIFICATION - {chain.upper()}")
-        print(f"{'='*60}")
-
-        # Query stETH contract
-        total_pooled_ether = steth_contract.functions.getTotalPooledEther().call()
-        total_supply = steth_contract.functions.totalSupply().call()
-        total_shares = steth_contract.functions.getTotalShares().call()
-        buffered_ether = steth_contract.functions.getBufferedEther().call()
-
-        # Get beacon chain stats
-        beacon_stat = steth_contract.functions.getBeaconStat().call()
+        steth_contract = get_contract(w3, _checksum(steth_address), "lido")
+        calls = [
+            (steth_contract, "getTotalPooledEther"),
+            (steth_contract, "totalSupply"),
+            (steth_contract, "getTotalShares"),
+            (steth_contract, "getBufferedEther"),
+            (steth_contract, "getBeaconStat"),
+        ]
+
+        # wstETH reads ride along in the same aggregate, but may fail on their own
+        wsteth_contract = None
+        if wsteth_address:
+            try:
+                wsteth_contract = get_contract(w3, _checksum(wsteth_address), "wsteth")
+                calls += [(wsteth_contract, "totalSupply"), (wsteth_contract, "stEthPerToken")]
+            except Exception as e:
+                logger.warning("  wstETH query failed: %s", e)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n%s", "="*60)
+            logger.debug("LIDO RESERVE VERIFICATION - %s", chain.upper())
+            logger.debug("%s", "="*60)
+
+        # Query stETH (including beacon chain stats) and wstETH in one round-trip
+        values = call_first_rpc(chain, rpc_urls, lambda w3: multicall(w3, calls, allow_failure=True))
+        if any(value is None for value in values[:5]):
+            raise ValueError(f"stETH contract call reverted: {steth_address}")
+        total_pooled_ether, total_supply, total_shares, buffered_ether, beacon_stat = values[:5]
         deposited_validators = beacon_stat[0]
         beacon_validators = beacon_stat[1]
         beacon_balance = beacon_stat[2]
@@ -333,17 +652,18 @@ def analyze_lido_reserve(
         transient_validators = deposited_validators - beacon_validators
         transient_balance_eth = transient_validators * 32  # Each validator = 32 ETH
 
-        # Print component breakdown
-        print(f"\nstETH Total Supply: {total_supply_eth:,.4f} ETH")
-        print(f"Total Pooled Ether: {total_pooled_eth:,.4f} ETH")
-        print(f"\nComponent Breakdown:")
-        print(f"  Beacon Balance: {beacon_balance_eth:,.4f} ETH ({beacon_validators} validators)")
-        print(f"  Buffered Ether: {buffered_eth:,.4f} ETH")
-        print(f"  Transient Balance: {transient_balance_eth:,.4f} ETH ({transient_validators} validators in transit)")
+        # Log component breakdown (%-style has no thousands separator, hence format())
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\nstETH Total Supply: %s ETH", format(total_supply_eth, ",.4f"))
+            logger.debug("Total Pooled Ether: %s ETH", format(total_pooled_eth, ",.4f"))
+            logger.debug("\nComponent Breakdown:")
+            logger.debug("  Beacon Balance: %s ETH (%s validators)", format(beacon_balance_eth, ",.4f"), beacon_validators)
+            logger.debug("  Buffered Ether: %s ETH", format(buffered_eth, ",.4f"))
+            logger.debug("  Transient Balance: %s ETH (%s validators in transit)", format(transient_balance_eth, ",.4f"), transient_validators)
 
         # Backing ratio (should be 1.0 by design)
         backing_ratio = total_pooled_eth / total_supply_eth if total_supply_eth > 0 else 0
-        print(f"\nBacking Ratio: {backing_ratio:.6f} ({backing_ratio * 100:.4f}%)")
+        logger.debug("\nBacking Ratio: %.6f (%.4f%%)", backing_ratio, backing_ratio * 100)
 
         # Store components
         result["components"] = {
@@ -360,24 +680,21 @@ def analyze_lido_reserve(
 
         # Query wstETH if available
         wsteth_data = {}
-        if wsteth_address:
+        if wsteth_contract is not None:
             try:
-                wsteth_contract = w3.eth.contract(
-                    address=Web3.to_checksum_address(wsteth_address),
-                    abi=WSTETH_ABI
-                )
-
-                wsteth_supply = wsteth_contract.functions.totalSupply().call()
-                steth_per_token = wsteth_contract.functions.stEthPerToken().call()
+                wsteth_supply, steth_per_token = values[5:]
+                if wsteth_supply is None or steth_per_token is None:
+                    raise ValueError(f"wstETH contract call reverted: {wsteth_address}")
 
                 wsteth_supply_tokens = wsteth_supply / 1e18
                 steth_per_wsteth = steth_per_token / 1e18
                 wsteth_backing_in_steth = wsteth_supply_tokens * steth_per_wsteth
 
-                print(f"\nwstETH Data:")
-                print(f"  wstETH Total Supply: {wsteth_supply_tokens:,.4f} wstETH")
-                print(f"  stETH per wstETH: {steth_per_wsteth:.6f}")
-                print(f"  wstETH backing in stETH: {wsteth_backing_in_steth:,.4f} stETH")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("\nwstETH Data:")
+                    logger.debug("  wstETH Total Supply: %s wstETH", format(wsteth_supply_tokens, ",.4f"))
+                    logger.debug("  stETH per wstETH: %.6f", steth_per_wsteth)
+                    logger.debug("  wstETH backing in stETH: %s stETH", format(wsteth_backing_in_steth, ",.4f"))
 
                 wsteth_data = {
                     "wsteth_supply": wsteth_supply_tokens,
@@ -387,7 +704,7 @@ def analyze_lido_reserve(
                 result["components"]["wsteth"] = wsteth_data
 
             except Exception as e:
-                print(f"  wstETH query failed: {e}")
+                logger.warning("  wstETH query failed: %s", e)
 
         # Chain data for compatibility
         result["chain_data"].append({
@@ -399,17 +716,18 @@ def analyze_lido_reserve(
         # Calculate metrics (same format as Chainlink PoR)
         result["metrics"] = calculate_reserve_ratio(total_pooled_eth, total_supply_eth)
 
-        print(f"\n{'='*60}")
-        print(f"VERIFICATION COMPLETE")
-        print(f"  Status: {'FULLY BACKED' if backing_ratio >= 1.0 else 'UNDERCOLLATERALIZED'}")
-        print(f"  Score: {result['metrics']['score']:.1f}/100")
-        print(f"{'='*60}\n")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n%s", "="*60)
+            logger.debug("VERIFICATION COMPLETE")
+            logger.debug("  Status: %s", "FULLY BACKED" if backing_ratio >= 1.0 else "UNDERCOLLATERALIZED")
+            logger.debug("  Score: %.1f/100", result["metrics"]["score"])
+            logger.debug("%s\n", "="*60)
 
         result["status"] = "success"
 
     except Exception as e:
         result["error"] = str(e)
-        print(f"Error analyzing Lido reserve: {e}")
+        logger.warning("Error analyzing Lido reserve: %s", e)
 
     return result
 
@@ -456,7 +774,8 @@ def analyze_proof_of_reserve(
     evm_chains: list = None,
     solana_token: str = None,
     # New config-based approach
-    config: dict = None
+    config: dict = None,
+    cache_ttl: int = 0
 ) -> dict:
     """
     Analyze proof of reserves - agnostic dispatcher.
@@ -469,10 +788,28 @@ def analyze_proof_of_reserve(
         evm_chains: Legacy - list of chain configs for Chainlink PoR
         solana_token: Legacy - Solana token address
         config: Full proof_of_reserve config from JSON
+        cache_ttl: Reuse a successful result for the same arguments if it is
+                   under cache_ttl seconds old (default: 0, disabled)
 
     Returns:
         dict with reserve analysis (unified format)
     """
+    if cache_ttl <= 0:
+        return _analyze_proof_of_reserve(evm_chains, solana_token, config)
+
+    key = json.dumps([evm_chains, solana_token, config], sort_keys=True, default=str)
+    cached = _por_cache.get(key)
+    if cached and time.time() - cached[0] < cache_ttl:
+        return copy.deepcopy(cached[1])
+
+    result = _analyze_proof_of_reserve(evm_chains, solana_token, config)
+    if result.get("status") == "success":
+        _por_cache[key] = (time.time(), copy.deepcopy(result))
+    return result
+
+
+def _analyze_proof_of_reserve(evm_chains: list = None, solana_token: str = None, config: dict = None) -> dict:
+    """Uncached body of analyze_proof_of_reserve."""
     # If config provided, use new approach
     if config:
         verification_type = config.get("verification_type", "chainlink_por")
@@ -518,6 +855,10 @@ def analyze_proof_of_reserve(
 # =============================================================================
 
 if __name__ == "__main__":
+    # Show the analyzers' step-by-step output on the console
+    logging.basicConfig(format="%(message)s")
+    logger.setLevel(logging.DEBUG)
+
     print("Proof of Reserve Analyzer")
     print("=" * 50)
 
@@ -5,8 +5,11 @@ Simple CLI to run all risk analysis scripts with minimal configuration.
 """
 
 import json
+import threading
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from typing import Dict, Any, Optional
 
 # Import all analysis modules
@@ -618,6 +621,64 @@ def cmd_price(args):
         return {"status": "error", "error": str(e)}
 
 
+def run_per_chain(tasks: list) -> list:
+    """
+    Run independent per-chain analyses concurrently (they are RPC/API bound).
+
+    Each analysis is called with an emit keyword (a print-compatible
+    callable) instead of printing directly. The first unfinished chain's
+    output is printed as it arrives; later chains' output is held until
+    every chain before them is done, so the report reads in task order
+    without waiting for the slowest chain.
+
+    Args:
+        tasks: List of (chain_name, callable accepting emit=) tuples
+
+    Returns:
+        Non-empty results in task order; a failing chain is reported as
+        {"chain": chain_name, "error": message}
+    """
+    if not tasks:
+        return []
+
+    lock = threading.Lock()
+    pending_output = [[] for _ in tasks]
+    finished = [False] * len(tasks)
+    live = 0  # Index of the chain whose output is printed straight away
+
+    def make_emit(index):
+        def emit(*args, **kwargs):
+            with lock:
+                if index == live:
+                    print(*args, **kwargs)
+                else:
+                    pending_output[index].append((args, kwargs))
+        return emit
+
+    def run(index):
+        nonlocal live
+        chain, analyze = tasks[index]
+        try:
+            result = analyze(emit=make_emit(index))
+        except Exception as e:
+            result = {"chain": chain, "error": str(e)}
+
+        with lock:
+            finished[index] = True
+            while live < len(tasks) and finished[live]:
+                live += 1
+                if live < len(tasks):
+                    for args, kwargs in pending_output[live]:
+                        print(*args, **kwargs)
+                    pending_output[live].clear()
+        return result
+
+    with ThreadPoolExecutor(max_workers=min(8, len(tasks))) as executor:
+        results = list(executor.map(run, range(len(tasks))))
+
+    return [result for result in results if result]
+
+
 def run_from_config(config_path: str, output_path: str = None):
     """Run full framework from config file."""
     with open(config_path, 'r') as f:
@@ -636,15 +697,10 @@ def run_from_config(config_path: str, output_path: str = None):
         cfg = config["aave"]
         token = cfg.get("token_address")
         chains = cfg.get("chains", list(AAVE_CHAINS.keys()))
-        results["modules"]["aave"] = []
-        for chain in chains:
-            if chain in AAVE_CHAINS:
-                try:
-                    r = analyze_aave_market(token, chain, AAVE_CHAINS[chain])
-                    if r:
-                        results["modules"]["aave"].append(r)
-                except Exception as e:
-                    results["modules"]["aave"].append({"chain": chain, "error": str(e)})
+        results["modules"]["aave"] = run_per_chain([
+            (chain, partial(analyze_aave_market, token, chain, AAVE_CHAINS[chain]))
+            for chain in chains if chain in AAVE_CHAINS
+        ])
 
     if "compound" in config:
         print("\n" + "="*70)
@@ -653,15 +709,10 @@ def run_from_config(config_path: str, output_path: str = None):
         cfg = config["compound"]
         token = cfg.get("token_address")
         chains = cfg.get("chains", list(COMPOUND_MARKETS.keys()))
-        results["modules"]["compound"] = []
-        for chain in chains:
-            if chain in COMPOUND_MARKETS:
-                try:
-                    r = analyze_compound_market(token, chain, COMPOUND_MARKETS[chain])
-                    if r:
-                        results["modules"]["compound"].append(r)
-                except Exception as e:
-                    results["modules"]["compound"].append({"chain": chain, "error": str(e)})
+        results["modules"]["compound"] = run_per_chain([
+            (chain, partial(analyze_compound_market, token, chain, COMPOUND_MARKETS[chain]))
+            for chain in chains if chain in COMPOUND_MARKETS
+        ])
 
     if "uniswap" in config:
         print("\n" + "="*70)
@@ -702,18 +753,15 @@ def run_from_config(config_path: str, output_path: str = None):
         print("="*70)
         cfg = config["token_distribution"]
         token = cfg.get("token_address")
-        results["modules"]["token_distribution"] = []
-        for chain_cfg in cfg.get("chains", []):
-            try:
-                r = analyze_token(
-                    chain_cfg.get("token_address", token),
-                    chain_cfg["name"],
-                    chain_cfg.get("blockscout_url")
-                )
-                if r:
-                    results["modules"]["token_distribution"].append(r)
-            except Exception as e:
-                results["modules"]["token_distribution"].append({"chain": chain_cfg["name"], "error": str(e)})
+        results["modules"]["token_distribution"] = run_per_chain([
+            (chain_cfg["name"], partial(
+                analyze_token,
+                chain_cfg.get("token_address", token),
+                chain_cfg["name"],
+                chain_cfg.get("blockscout_url")
+            ))
+            for chain_cfg in cfg.get("chains", [])
+        ])
 
     if "price_risk" in config:
         print("\n" + "="*70)
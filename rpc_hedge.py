@@ -0,0 +1,52 @@
+"""
+RPC Hedging - Primary-first reads with delayed fallbacks.
+
+A read goes to the first endpoint only. The next endpoint is started once
+every request in flight has failed or RPC_HEDGE_DELAY seconds pass without
+an answer, and whichever answers first wins. Healthy primaries therefore see
+a single request per read, while a slow or dead one costs at most the delay.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+
+# Seconds to wait on an endpoint before also sending the read to the next one
+RPC_HEDGE_DELAY = 0.5
+
+
+def hedged_call(fn, candidates, delay: float = RPC_HEDGE_DELAY):
+    """
+    Return the first successful fn(candidate), trying candidates in order.
+
+    A call fails if it raises or returns None. Slower calls still in flight
+    are not waited for once one succeeds.
+
+    Returns:
+        The first non-None result. If every call failed, the last exception
+        is re-raised, or None is returned when none of them raised.
+    """
+    candidates = list(candidates)
+    if len(candidates) == 1:
+        return fn(candidates[0])
+
+    executor = ThreadPoolExecutor(max_workers=len(candidates))
+    try:
+        pending = set()
+        error = None
+        for candidate in candidates:
+            pending.add(executor.submit(fn, candidate))
+            done, pending = wait(pending, timeout=delay, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is not None:
+                    error = future.exception()
+                elif future.result() is not None:
+                    return future.result()
+        for future in as_completed(pending):
+            if future.exception() is not None:
+                error = future.exception()
+            elif future.result() is not None:
+                return future.result()
+        if error is not None:
+            raise error
+        return None
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
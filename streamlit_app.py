@@ -75,8 +75,8 @@ try:
     from uniswap import UniswapV3Analyzer
     from curve import CurveFinanceAnalyzer
     from fluid import analyze_fluid_pool
-    from proof_of_reserve import analyze_proof_of_reserve
-    from price_risk import get_coingecko_data, calculate_peg_deviation, calculate_metrics
+    from proof_of_reserve import analyze_proof_of_reserve, POR_CACHE_TTL
+    from price_risk import get_coingecko_data, calculate_peg_deviation, calculate_metrics, COINGECKO_CACHE_TTL
     from oracle_lag import analyze_oracle_lag, get_oracle_freshness
     from token_distribution import analyze_token as analyze_token_distribution
     from slippage_check import cross_verify_slippage
@@ -200,7 +200,7 @@ def fetch_price_data(config: dict) -> dict:
         # Fetch token prices (required for volatility calculation)
         token_prices = None
         if token_id:
-            _, token_prices = get_coingecko_data(token_id, days=365)
+            _, token_prices = get_coingecko_data(token_id, days=365, cache_ttl=COINGECKO_CACHE_TTL)
             if token_prices:
                 result["token_price"] = token_prices[-1]
 
@@ -214,7 +214,7 @@ def fetch_price_data(config: dict) -> dict:
 
         # Calculate peg deviation (requires both token and underlying prices)
         if token_id and underlying_id and token_prices:
-            _, underlying_prices = get_coingecko_data(underlying_id, days=365)
+            _, underlying_prices = get_coingecko_data(underlying_id, days=365, cache_ttl=COINGECKO_CACHE_TTL)
 
             if underlying_prices:
                 result["underlying_price"] = underlying_prices[-1]
@@ -252,7 +252,7 @@ def fetch_proof_of_reserve(config: dict) -> dict:
         if verification_type == "liquid_staking":
             # Liquid staking verification (wstETH, rETH, etc.)
             por_config_with_rpcs = {**por_config, "rpc_urls": rpc_urls}
-            por_result = analyze_proof_of_reserve(config=por_config_with_rpcs)
+            por_result = analyze_proof_of_reserve(config=por_config_with_rpcs, cache_ttl=POR_CACHE_TTL)
 
             result["protocol"] = por_result.get("protocol", "unknown")
 
@@ -504,7 +504,7 @@ def fetch_proof_of_reserve(config: dict) -> dict:
                 "solana_token": solana_token,
                 "rpc_urls": rpc_urls
             }
-            por_result = analyze_proof_of_reserve(config=por_config_with_rpcs)
+            por_result = analyze_proof_of_reserve(config=por_config_with_rpcs, cache_ttl=POR_CACHE_TTL)
 
             result["protocol"] = "chainlink"
             result["por_scope"] = por_scope
@@ -733,10 +733,10 @@ def fetch_dex_data(config: dict) -> dict:
             elif protocol == "pancakeswap":
                 # PancakeSwap uses the same subgraph format as Uniswap V3
                 try:
-                    from pancakeswap import PancakeSwapV3Analyzer
+                    from pancakeswap import PancakeSwapV3Analyzer, GRAPH_CACHE_TTL
                     subgraph_id = pool.get("subgraph_id")  # Use subgraph_id from config
-                    analyzer = PancakeSwapV3Analyzer(chain, GRAPH_API_KEY, subgraph_id=subgraph_id)
-                    pool_result = analyzer.analyze_pool(pool_addr)
+                    analyzer = PancakeSwapV3Analyzer(chain, GRAPH_API_KEY, subgraph_id=subgraph_id, verbose=False)
+                    pool_result = analyzer.analyze_pool(pool_addr, cache_ttl=GRAPH_CACHE_TTL)
                     pool_result["protocol"] = "PancakeSwap V3"
                 except ImportError:
                     # Fallback: use Uniswap analyzer with PancakeSwap subgraph
@@ -1001,7 +1001,8 @@ def fetch_oracle_data(config: dict) -> dict:
             freshness_result = get_oracle_freshness(
                 oracle_addresses=[address],
                 chain_name=chain,
-                custom_rpc=custom_rpc
+                custom_rpc=custom_rpc,
+                verbose=False
             )
 
             if freshness_result.get("status") == "success":
@@ -1055,7 +1056,8 @@ def fetch_oracle_data(config: dict) -> dict:
                     chain2_name=chain2,
                     oracle2_address=feed_2.get("address"),
                     chain1_rpc=rpc_urls.get(chain1),
-                    chain2_rpc=rpc_urls.get(chain2)
+                    chain2_rpc=rpc_urls.get(chain2),
+                    verbose=False
                 )
 
                 if lag_result.get("status") == "success":
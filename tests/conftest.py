@@ -231,14 +231,14 @@ def mock_coingecko_response() -> Dict[str, Any]:
 @pytest.fixture
 def mock_requests_get(mock_coingecko_response):
     """
-    Mock requests.get for API testing.
+    Mock requests GETs (including those made through a Session) for API testing.
 
     Usage:
         def test_price_fetching(mock_requests_get):
-            # requests.get is already mocked
+            # requests.Session.get is already mocked
             result = fetch_price_data("ethereum")
     """
-    with patch("requests.get") as mock_get:
+    with patch("requests.Session.get") as mock_get:
         mock_response = MagicMock()
         mock_response.json.return_value = mock_coingecko_response
         mock_response.status_code = 200
@@ -14,6 +14,7 @@ import json
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import price_risk
 from price_risk import (
     get_coingecko_data,
     calculate_peg_deviation,
@@ -39,7 +40,7 @@ class TestGetCoingeckoData:
     @pytest.mark.fetcher
     def test_handles_api_error_gracefully(self):
         """Should handle API errors without crashing."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_get.side_effect = Exception("API Error")
 
             try:
@@ -54,7 +55,7 @@ class TestGetCoingeckoData:
     @pytest.mark.fetcher
     def test_handles_rate_limit(self):
         """Should handle rate limit responses."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = MagicMock()
             mock_response.status_code = 429
             mock_response.json.return_value = {"error": "rate limit"}
@@ -65,6 +66,58 @@ class TestGetCoingeckoData:
             with pytest.raises(KeyError):
                 get_coingecko_data("ethereum")
 
+    @pytest.mark.integration
+    @pytest.mark.fetcher
+    def test_cache_revalidates_with_etag(self, mock_coingecko_response, tmp_path, monkeypatch):
+        """Cached responses should be reused, then revalidated with If-None-Match."""
+        monkeypatch.setattr(price_risk, "COINGECKO_CACHE_DIR", str(tmp_path))
+
+        with patch("requests.Session.get") as mock_get:
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.headers = {"ETag": '"v1"'}
+            mock_response.json.return_value = mock_coingecko_response
+            mock_get.return_value = mock_response
+
+            first = get_coingecko_data("ethereum", cache_ttl=3600)
+            assert get_coingecko_data("ethereum", cache_ttl=3600) == first
+            assert mock_get.call_count == 1
+
+            # Expire the entry: the next call revalidates and a 304 reuses the data
+            monkeypatch.setattr(price_risk.time, "time", lambda: 10**10)
+            not_modified = MagicMock(status_code=304, headers={})
+            mock_get.return_value = not_modified
+
+            assert get_coingecko_data("ethereum", cache_ttl=3600) == first
+            assert mock_get.call_count == 2
+            assert mock_get.call_args.kwargs["headers"]["If-None-Match"] == '"v1"'
+
+    @pytest.mark.integration
+    @pytest.mark.fetcher
+    @pytest.mark.parametrize("entry", [
+        [],
+        {"data": 1},
+        {"fetched_at": 10**10, "data": {"prices": [[0, 1.0]]}},
+    ])
+    def test_malformed_cache_entry_is_a_miss(self, mock_coingecko_response, tmp_path, monkeypatch, entry):
+        """Planted or corrupt cache files (incl. a future fetched_at) must not be used."""
+        monkeypatch.setattr(price_risk, "COINGECKO_CACHE_DIR", str(tmp_path))
+
+        with patch("requests.Session.get") as mock_get:
+            mock_response = MagicMock(status_code=200, headers={})
+            mock_response.json.return_value = mock_coingecko_response
+            mock_get.return_value = mock_response
+
+            get_coingecko_data("ethereum", cache_ttl=3600)
+            for path in tmp_path.iterdir():
+                path.write_text(json.dumps(entry))
+            mock_get.reset_mock()
+
+            _, prices = get_coingecko_data("ethereum", cache_ttl=3600)
+
+            assert mock_get.call_count == 1
+            assert prices == [item[1] for item in mock_coingecko_response["prices"]]
+
 
 class TestCalculatePegDeviation:
     """Tests for peg deviation calculation."""
@@ -0,0 +1,97 @@
+"""
+Unit tests for disk_cache module.
+
+Tests the atomic JSON writer, entry validation and directory pruning used by
+the on-disk caches. These tests only touch a temporary directory.
+"""
+
+import os
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import disk_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Point CACHE_DIR at a not yet created temporary directory."""
+    root = tmp_path / "risk_framework"
+    monkeypatch.setattr(disk_cache, "CACHE_DIR", str(root))
+    return root
+
+
+class TestWriteJson:
+    """Tests for write_json / read_json."""
+
+    @pytest.mark.unit
+    def test_round_trip_creates_private_dirs(self, cache_dir):
+        path = disk_cache.cache_path("sub", "entry.json")
+
+        assert disk_cache.write_json(path, {"a": 1})
+
+        assert disk_cache.read_json(path) == {"a": 1}
+        assert os.stat(cache_dir).st_mode & 0o777 == 0o700
+        assert os.stat(cache_dir / "sub").st_mode & 0o777 == 0o700
+
+    @pytest.mark.unit
+    def test_failed_write_leaves_no_temp_file(self, cache_dir):
+        path = disk_cache.cache_path("entry.json")
+        disk_cache.write_json(path, {"a": 1})
+
+        assert not disk_cache.write_json(path, {"a": object()})
+
+        assert os.listdir(cache_dir) == ["entry.json"]
+        assert disk_cache.read_json(path) == {"a": 1}
+
+    @pytest.mark.unit
+    def test_unreadable_file_reads_as_none(self, cache_dir):
+        cache_dir.mkdir()
+        (cache_dir / "bad.json").write_text("{not json")
+        assert disk_cache.read_json(str(cache_dir / "bad.json")) is None
+        assert disk_cache.read_json(str(cache_dir / "missing.json")) is None
+
+
+class TestEntryValidation:
+    """Tests for valid_fetched_at / is_fresh."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("entry", [
+        [],
+        {"data": 1},
+        {"fetched_at": "1"},
+        {"fetched_at": True},
+        {"fetched_at": float("nan")},
+        {"fetched_at": time.time() + 3600},
+    ])
+    def test_rejects_malformed_entries(self, entry):
+        assert not disk_cache.valid_fetched_at(entry)
+        assert not disk_cache.is_fresh(entry, 10 ** 9)
+
+    @pytest.mark.unit
+    def test_fresh_only_within_ttl(self):
+        entry = {"fetched_at": time.time() - 60}
+        assert disk_cache.is_fresh(entry, 120)
+        assert not disk_cache.is_fresh(entry, 30)
+
+
+class TestPruneDir:
+    """Tests for prune_dir."""
+
+    @pytest.mark.unit
+    def test_drops_old_and_excess_files(self, tmp_path):
+        now = time.time()
+        for age in range(5):
+            path = tmp_path / f"{age}.json"
+            path.write_text("{}")
+            os.utime(path, (now - age * 100, now - age * 100))
+        (tmp_path / "keep.tmp").write_text("")
+
+        disk_cache.prune_dir(str(tmp_path), max_age=250, max_entries=2)
+
+        assert sorted(os.listdir(tmp_path)) == ["0.json", "1.json", "keep.tmp"]
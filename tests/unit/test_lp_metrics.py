@@ -0,0 +1,135 @@
+"""
+Unit tests for lp_metrics module.
+
+Checks the NumPy LP concentration metrics, as used by the PancakeSwap and
+Uniswap analyzers, against the original per-owner dict / sort
+implementation, including owners tied on liquidity. These tests are
+isolated and don't require subgraph access.
+"""
+
+import random
+from collections import defaultdict
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import lp_metrics
+from pancakeswap import PancakeSwapV3Analyzer
+from uniswap import UniswapV3Analyzer
+
+
+def reference_metrics(positions):
+    """The original dict-and-sort calculate_metrics, kept as the reference."""
+    owner_liquidity = defaultdict(float)
+    for pos in positions:
+        owner_liquidity[pos["owner"]] += float(pos["liquidity"])
+
+    total_liquidity = sum(owner_liquidity.values())
+    sorted_owners = sorted(owner_liquidity.items(), key=lambda x: x[1], reverse=True)
+
+    market_shares = []
+    hhi = 0.0
+    for owner, liquidity in sorted_owners:
+        share_pct = (liquidity / total_liquidity) * 100
+        market_shares.append((owner, liquidity, share_pct))
+        hhi += share_pct ** 2
+
+    def get_top_concentration(n):
+        return sum(share for _, _, share in market_shares[:n])
+
+    return {
+        "unique_holders": len(owner_liquidity),
+        "total_liquidity": total_liquidity,
+        "hhi": hhi,
+        "top_1": get_top_concentration(1),
+        "top_3": get_top_concentration(3),
+        "top_5": get_top_concentration(5),
+        "top_10": get_top_concentration(10),
+        "top_lps": market_shares[:10],
+    }
+
+
+def make_positions(liquidities):
+    """Positions as returned by the subgraph: string liquidity, owners may repeat."""
+    return [{"owner": owner, "liquidity": str(liquidity)} for owner, liquidity in liquidities]
+
+
+def assert_same_metrics(actual, expected):
+    assert actual["unique_holders"] == expected["unique_holders"]
+    for key in ("total_liquidity", "hhi", "top_1", "top_3", "top_5", "top_10"):
+        assert actual[key] == pytest.approx(expected[key], rel=1e-12), key
+    assert [owner for owner, _, _ in actual["top_lps"]] == [owner for owner, _, _ in expected["top_lps"]]
+    assert [lp[1:] for lp in actual["top_lps"]] == pytest.approx([lp[1:] for lp in expected["top_lps"]], rel=1e-12)
+
+
+@pytest.fixture(params=[("pancakeswap", "pandas"), ("pancakeswap", "dict"), ("uniswap", "pandas")])
+def analyzer(request, monkeypatch):
+    """Analyzer with owner aggregation through pandas.factorize or the dict fallback."""
+    protocol, aggregation = request.param
+    if aggregation == "dict":
+        monkeypatch.setattr(lp_metrics, "pd", None)
+    elif lp_metrics.pd is None:
+        pytest.skip("pandas not installed")
+    if protocol == "uniswap":
+        # Skip the subgraph schema probe
+        monkeypatch.setattr(UniswapV3Analyzer, "_detect_schema", lambda self: "uniswap")
+        return UniswapV3Analyzer("ethereum")
+    return PancakeSwapV3Analyzer("bsc", subgraph_id="test", verbose=False)
+
+
+CASES = {
+    "distinct": [(f"0x{i:02x}", 1000 - i * 7) for i in range(40)],
+    "repeat_owners": [(f"0x{i % 6:02x}", 100 + i) for i in range(30)],
+    "fewer_than_top": [("0xa", 5), ("0xb", 3), ("0xa", 1)],
+    # Ties straddling the top-10 cut keep first-seen order, as the stable sort did
+    "ties_at_cut": [(f"0x{i:02x}", 50 if i >= 4 else 100) for i in range(20)],
+    "all_tied": [(f"0x{i:02x}", 7) for i in range(15)],
+    "ties_after_aggregation": [("0xa", 3), ("0xb", 5), ("0xc", 2), ("0xa", 2), ("0xd", 5), ("0xc", 3)],
+    "single": [("0xa", 42)],
+}
+
+
+class TestCalculateMetrics:
+    """Equivalence of calculate_metrics with the original implementation."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("case", list(CASES))
+    def test_matches_reference(self, analyzer, case):
+        positions = make_positions(CASES[case])
+        assert_same_metrics(analyzer.calculate_metrics(positions, {}), reference_metrics(positions))
+
+    @pytest.mark.unit
+    def test_matches_reference_random(self, analyzer):
+        """Random pools with few distinct liquidity values, so ties are common."""
+        rng = random.Random(0)
+        for _ in range(50):
+            positions = make_positions(
+                (f"0x{rng.randrange(30):02x}", rng.choice([1, 2, 5, 10, 10 ** 18]))
+                for _ in range(rng.randrange(1, 80))
+            )
+            assert_same_metrics(analyzer.calculate_metrics(positions, {}), reference_metrics(positions))
+
+    @pytest.mark.unit
+    def test_warns_above_float64_exact_range(self, caplog, monkeypatch):
+        """Liquidity beyond 2**53 is flagged as rounded by float64, once."""
+        monkeypatch.setattr(lp_metrics, "_float64_warned", False)
+        positions = make_positions([("0xa", 2 ** 53 + 1), ("0xb", 5)])
+        with caplog.at_level("WARNING", logger="lp_metrics"):
+            lp_metrics.concentration_metrics(*lp_metrics.position_columns(positions))
+        assert "2**53" in caplog.text
+
+        caplog.clear()
+        with caplog.at_level("WARNING", logger="lp_metrics"):
+            lp_metrics.concentration_metrics(*lp_metrics.position_columns(positions))
+        assert caplog.text == ""
+
+    @pytest.mark.unit
+    def test_no_positions(self, analyzer):
+        metrics = analyzer.calculate_metrics([], {})
+        assert metrics["unique_holders"] == 0
+        assert metrics["top_10"] == 0.0
+        assert metrics["top_lps"] == []
@@ -0,0 +1,166 @@
+"""
+Unit tests for oracle_lag module.
+
+Tests that every fetch path checks the RPC against the configured chain id,
+and that the on-disk read cache rejects malformed entries. RPC access is
+patched out, so no blockchain connection is needed.
+"""
+
+import json
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import oracle_lag
+
+
+ORACLE_A = "0x5f4ec3df9cbd43714fe2740f5e3616155c5b8419"
+ORACLE_B = "0xab594600376ec9fd91f8e885dadf0ce036862de0"
+
+
+class TestChainIdCheck:
+    """Tests for the chain id verification of oracle reads."""
+
+    @pytest.mark.unit
+    def test_single_read_rejects_wrong_chain(self, monkeypatch):
+        """A lone oracle read on an RPC serving another chain returns None."""
+        monkeypatch.setattr(oracle_lag, "_rpc_chain_id", lambda rpc_url: 137)
+
+        assert oracle_lag.get_oracle_data("http://rpc", ORACLE_A, expected_chain_id=1) is None
+
+    @pytest.mark.unit
+    def test_failover_passes_chain_id(self, monkeypatch):
+        """Fallback endpoints are checked against the expected chain id too."""
+        seen = []
+        monkeypatch.setattr(
+            oracle_lag, "get_oracle_data",
+            lambda rpc_url, address, cache_ttl=0, expected_chain_id=None, emit=print: seen.append((rpc_url, expected_chain_id))
+        )
+
+        oracle_lag.get_oracle_data_failover(["http://a", "http://b"], ORACLE_A, 10)
+
+        assert sorted(seen) == [("http://a", 10), ("http://b", 10)]
+
+    @pytest.mark.unit
+    def test_failover_reads_primary_first(self, monkeypatch, capsys):
+        """A healthy primary gets the only request; fallback errors stay quiet."""
+        seen = []
+
+        def fake_get_oracle_data(rpc_url, address, cache_ttl=0, expected_chain_id=None, emit=print):
+            seen.append(rpc_url)
+            return {"price": 1, "updated_at": 1}
+
+        monkeypatch.setattr(oracle_lag, "get_oracle_data", fake_get_oracle_data)
+
+        assert oracle_lag.get_oracle_data_failover(["http://a", "http://b"], ORACLE_A) == {"price": 1, "updated_at": 1}
+        assert seen == ["http://a"]
+
+    @pytest.mark.unit
+    def test_failover_prints_only_when_all_fail(self, monkeypatch, capsys):
+        """Per-endpoint errors are collected and only the last one is printed."""
+        def fake_get_oracle_data(rpc_url, address, cache_ttl=0, expected_chain_id=None, emit=print):
+            emit(f"Error fetching data: {rpc_url} down")
+            return None
+
+        monkeypatch.setattr(oracle_lag, "get_oracle_data", fake_get_oracle_data)
+
+        assert oracle_lag.get_oracle_data_failover(["http://a", "http://b"], ORACLE_A) is None
+        assert capsys.readouterr().out == "Error fetching data: http://b down\n"
+
+    @pytest.mark.unit
+    def test_fetch_oracles_groups_by_rpc_and_chain(self, monkeypatch):
+        """Two chains sharing an RPC are fetched (and checked) separately."""
+        calls = []
+
+        def fake_failover(rpc_urls, address, expected_chain_id=None):
+            calls.append((rpc_urls[0], address, expected_chain_id))
+            return {"price": 1}
+
+        monkeypatch.setattr(oracle_lag, "get_oracle_data_failover", fake_failover)
+        chain1 = {"rpc": "http://shared", "chain_id": 1}
+        chain2 = {"rpc": "http://shared", "chain_id": 137}
+
+        results = oracle_lag.fetch_oracles([(chain1, ORACLE_A), (chain2, ORACLE_B)])
+
+        assert results == [{"price": 1}, {"price": 1}]
+        assert sorted(calls) == [("http://shared", ORACLE_A, 1), ("http://shared", ORACLE_B, 137)]
+
+
+class TestStaleRounds:
+    """Tests that stale rounds are reported but kept out of lag aggregates."""
+
+    @pytest.mark.unit
+    def test_cross_chain_skips_stale_round(self, monkeypatch):
+        """A stale chain is flagged and excluded from the cross-chain lag."""
+        monkeypatch.setattr(oracle_lag, "fetch_oracles", lambda requests, max_workers=8: [
+            {"round_id": 5, "price": 1, "updated_at": 1, "stale": True},
+            {"round_id": 7, "price": 1, "updated_at": 1_000},
+            {"round_id": 9, "price": 1, "updated_at": 1_600},
+        ])
+
+        result = oracle_lag.get_cross_chain_oracle_freshness([
+            {"chain": "ethereum", "oracle_address": ORACLE_A},
+            {"chain": "arbitrum", "oracle_address": ORACLE_A},
+            {"chain": "base", "oracle_address": ORACLE_B},
+        ], verbose=False)
+
+        assert result["chains"][0]["stale"] is True
+        assert result["cross_chain_lag"]["lag_seconds"] == 600
+        assert result["cross_chain_lag"]["oldest_chain"] != result["chains"][0]["chain"]
+
+
+@pytest.fixture
+def oracle_cache(tmp_path, monkeypatch):
+    """Point the oracle read cache at an empty temporary file."""
+    path = tmp_path / "oracle_lag_cache.json"
+    monkeypatch.setattr(oracle_lag, "ORACLE_CACHE_PATH", str(path))
+    monkeypatch.setattr(oracle_lag, "_memory_cache", {})
+    return path
+
+
+class TestOracleCache:
+    """Tests for the on-disk oracle read cache."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("content", [
+        [],
+        {"http://rpc|" + ORACLE_A: []},
+        {"http://rpc|" + ORACLE_A: {"price": 1, "updated_at": 1}},
+        {"http://rpc|" + ORACLE_A: {"price": 1, "updated_at": 1, "fetched_at": 10 ** 12}},
+        {"http://rpc|" + ORACLE_A: {"price": "1", "updated_at": 1, "fetched_at": 1}},
+    ])
+    def test_malformed_cache_is_a_miss(self, oracle_cache, monkeypatch, content):
+        """Non-dict files, bad entries and future fetched_at are ignored, not raised."""
+        oracle_cache.write_text(json.dumps(content))
+        fetched = {"price": 2, "updated_at": 2, "round_id": 2}
+        monkeypatch.setattr(oracle_lag, "_fetch_oracle_data", lambda *args: fetched)
+
+        assert oracle_lag.get_oracle_data("http://rpc", ORACLE_A, cache_ttl=10 ** 9) == fetched
+
+    @pytest.mark.unit
+    def test_batch_written_once_and_expired_pruned(self, oracle_cache, monkeypatch):
+        """A chain batch rewrites the file once and drops entries older than cache_ttl."""
+        old = {"price": 1, "updated_at": 1, "fetched_at": time.time() - 120}
+        oracle_cache.write_text(json.dumps({"http://rpc|0xold": old}))
+        writes = []
+        write_json = oracle_lag.write_json
+        monkeypatch.setattr(oracle_lag, "write_json", lambda path, data: writes.append(data) or write_json(path, data))
+        monkeypatch.setattr(
+            oracle_lag, "multicall_latest_round_data",
+            lambda rpc_url, addresses, expected_chain_id=None: [{"price": 3, "updated_at": 3}] * len(addresses)
+        )
+
+        results = oracle_lag.fetch_chain_oracles({"rpc": "http://rpc"}, [ORACLE_A, ORACLE_B], cache_ttl=60)
+
+        assert results == [{"price": 3, "updated_at": 3}] * 2
+        assert len(writes) == 1
+        assert sorted(json.loads(oracle_cache.read_text())) == [
+            "http://rpc|" + ORACLE_A, "http://rpc|" + ORACLE_B
+        ]
+        assert oracle_lag.fetch_chain_oracles({"rpc": "http://rpc"}, [ORACLE_A, ORACLE_B], cache_ttl=60) == results
+        assert len(writes) == 1
@@ -0,0 +1,55 @@
+"""
+Unit tests for price_risk module.
+
+Tests the VaR / CVaR calculations read from the sorted returns against the
+plain NumPy definitions. These tests are isolated and don't require
+CoinGecko access.
+"""
+
+import numpy as np
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from price_risk import calculate_metrics
+
+
+def reference_metrics(prices):
+    """VaR via np.percentile and CVaR via a boolean mask on finite returns."""
+    prices = np.array(prices, dtype=float)
+    returns = np.diff(prices) / prices[:-1]
+    returns = returns[np.isfinite(returns)]
+    var_95 = np.percentile(returns, 5)
+    var_99 = np.percentile(returns, 1)
+    return {
+        'Annualized Volatility': f"{np.std(returns) * np.sqrt(365):.2%}",
+        'VaR 95%': f"{var_95:.2%}",
+        'VaR 99%': f"{var_99:.2%}",
+        'CVaR 95%': f"{returns[returns <= var_95].mean():.2%}",
+        'CVaR 99%': f"{returns[returns <= var_99].mean():.2%}",
+    }
+
+
+class TestCalculateMetrics:
+    """Tests for calculate_metrics."""
+
+    @pytest.mark.unit
+    def test_matches_numpy_percentile(self):
+        rng = np.random.default_rng(0)
+        prices = 100 * np.cumprod(1 + rng.normal(0, 0.02, 365))
+        assert calculate_metrics(prices) == reference_metrics(prices)
+
+    @pytest.mark.unit
+    def test_non_finite_returns_are_dropped(self):
+        """NaN and zero prices must not turn VaR / CVaR into nan or inf."""
+        rng = np.random.default_rng(1)
+        prices = 100 * np.cumprod(1 + rng.normal(0, 0.02, 365))
+        prices[[50, 51, 200]] = [np.nan, 0.0, np.nan]
+
+        metrics = calculate_metrics(prices)
+
+        assert metrics == reference_metrics(prices)
+        assert not any(word in value for value in metrics.values() for word in ("nan", "inf"))
@@ -17,6 +17,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from primary_checks import (
     run_primary_checks,
+    run_primary_checks_batch,
     check_has_security_audit,
     check_no_critical_audit_issues,
     check_no_active_incident,
@@ -202,3 +203,37 @@ class TestRunPrimaryChecks:
 
         failing_result = run_primary_checks(failing_audit_metrics)
         assert "disqualified" in failing_result["summary"].lower()
+
+
+class TestRunPrimaryChecksBatch:
+    """Tests for the batched run_primary_checks_batch function."""
+
+    @pytest.mark.unit
+    @pytest.mark.scoring
+    def test_matches_single_asset_results(self, passing_primary_checks_metrics, failing_critical_issues_metrics):
+        """Qualified assets should get the same result as run_primary_checks."""
+        results = run_primary_checks_batch([passing_primary_checks_metrics, failing_critical_issues_metrics])
+        assert len(results) == 2
+        assert results[0] == run_primary_checks(passing_primary_checks_metrics)
+        assert results[1]["qualified"] is False
+        assert results[1]["failed_checks"] == ["no_critical_audit_issues"]
+
+    @pytest.mark.unit
+    @pytest.mark.scoring
+    def test_skips_checks_after_first_failure(self, failing_audit_metrics):
+        """Checks after the first failure should be reported as UNKNOWN."""
+        result = run_primary_checks_batch([failing_audit_metrics])[0]
+        assert result["qualified"] is False
+        assert result["failed_checks"] == ["has_security_audit"]
+        assert result["total_count"] == 3
+        assert result["passed_count"] == 0
+        assert [c.status for c in result["checks"][1:]] == [CheckStatus.UNKNOWN, CheckStatus.UNKNOWN]
+        assert [c.check_id for c in result["checks"]] == list(PRIMARY_CHECKS)
+
+    @pytest.mark.unit
+    @pytest.mark.scoring
+    def test_preserves_input_order(self, passing_primary_checks_metrics, failing_audit_metrics):
+        """Results should come back in input order."""
+        all_metrics = [passing_primary_checks_metrics, failing_audit_metrics] * 5
+        results = run_primary_checks_batch(all_metrics)
+        assert [r["qualified"] for r in results] == [True, False] * 5
@@ -0,0 +1,284 @@
+"""
+Unit tests for proof_of_reserve module.
+
+Tests the reserve ratio scoring logic and the Multicall3 read path. These
+tests are isolated and don't require blockchain connections: eth_call is
+answered by an in-process fake.
+"""
+
+import json
+import pytest
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import proof_of_reserve
+from web3 import Web3
+
+
+POR_FEED = Web3.to_checksum_address("0x" + "a1" * 20)
+TOKEN = Web3.to_checksum_address("0x" + "b2" * 20)
+
+
+def make_w3(contracts, chain_id=1, rpc_url="http://fake-rpc"):
+    """
+    Web3 instance whose eth_call executes Multicall3.aggregate3 in memory.
+
+    Args:
+        contracts: {address: {function_name: (output_types, values)}}; a
+                   missing function reverts
+    """
+    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    functions = {
+        (address.lower(), proof_of_reserve.READ_CALLS[name][0]): outputs
+        for address, fns in contracts.items()
+        for name, outputs in fns.items()
+    }
+    functions[(proof_of_reserve.MULTICALL3.lower(), proof_of_reserve.READ_CALLS["getChainId"][0])] = (["uint256"], [chain_id])
+    functions[(proof_of_reserve.MULTICALL3.lower(), proof_of_reserve.READ_CALLS["getBlockNumber"][0])] = (["uint256"], [1000])
+    w3.eth_calls = []
+    w3.blocks = []
+
+    def eth_call(tx, block_identifier="latest"):
+        assert tx["to"] == proof_of_reserve.MULTICALL3
+        assert tx["data"][:4] == proof_of_reserve.AGGREGATE3_SELECTOR
+        (calls,) = w3.codec.decode(["(address,bool,bytes)[]"], tx["data"][4:])
+        w3.eth_calls.append(calls)
+        w3.blocks.append(block_identifier)
+        responses = []
+        for target, allow_failure, calldata in calls:
+            outputs = functions.get((target.lower(), bytes(calldata)))
+            if outputs is None:
+                if not allow_failure:
+                    raise ValueError("execution reverted")
+                responses.append((False, b""))
+            else:
+                responses.append((True, w3.codec.encode(*outputs)))
+        return w3.codec.encode(["(bool,bytes)[]"], [responses])
+
+    w3.eth.call = eth_call
+    return w3
+
+
+@pytest.fixture
+def decimals_cache(tmp_path, monkeypatch):
+    """Point the decimals cache at an empty temporary directory."""
+    monkeypatch.setattr(proof_of_reserve, "POR_DECIMALS_PATH", str(tmp_path / "por_decimals.json"))
+    monkeypatch.setattr(proof_of_reserve, "_rpc_chain_ids", {})
+    proof_of_reserve._get_decimals_cache.cache_clear()
+    yield tmp_path
+    proof_of_reserve._get_decimals_cache.cache_clear()
+
+
+def feed_and_token(feed_decimals=8, token_decimals=8):
+    return {
+        POR_FEED: {
+            "latestRoundData": (["uint80", "int256", "uint256", "uint256", "uint80"], [7, 150_000 * 10**feed_decimals, 1, 1, 7]),
+            "decimals": (["uint8"], [feed_decimals]),
+        },
+        TOKEN: {
+            "totalSupply": (["uint256"], [140_000 * 10**token_decimals]),
+            "decimals": (["uint8"], [token_decimals]),
+        },
+    }
+
+
+class TestMulticall:
+    """Tests for the Multicall3 aggregate3 encode / decode path."""
+
+    @pytest.mark.unit
+    def test_encodes_one_aggregate3_call(self):
+        """Sub-calls carry the target, allow_failure flag and the ABI's calldata."""
+        w3 = make_w3(feed_and_token())
+        feed = proof_of_reserve.get_contract(w3, POR_FEED, "chainlink")
+        token = proof_of_reserve.get_contract(w3, TOKEN, "token")
+
+        proof_of_reserve.multicall(w3, [(feed, "latestRoundData"), (token, "totalSupply")], block_identifier=123)
+
+        (calls,) = w3.eth_calls
+        assert [(target, allow_failure, "0x" + calldata.hex()) for target, allow_failure, calldata in calls] == [
+            (POR_FEED.lower(), False, feed.encode_abi("latestRoundData")),
+            (TOKEN.lower(), False, token.encode_abi("totalSupply")),
+        ]
+        assert w3.blocks == [123]
+
+    @pytest.mark.unit
+    def test_decodes_tuples_and_unwraps_single_values(self):
+        """Multi-output functions return tuples, single outputs are unwrapped."""
+        w3 = make_w3(feed_and_token())
+        feed = proof_of_reserve.get_contract(w3, POR_FEED, "chainlink")
+        token = proof_of_reserve.get_contract(w3, TOKEN, "token")
+
+        round_data, supply, decimals = proof_of_reserve.multicall(
+            w3, [(feed, "latestRoundData"), (token, "totalSupply"), (token, "decimals")]
+        )
+
+        assert round_data == (7, 150_000 * 10**8, 1, 1, 7)
+        assert supply == 140_000 * 10**8
+        assert decimals == 8
+
+    @pytest.mark.unit
+    def test_allow_failure_returns_none(self):
+        """With allow_failure, a reverting sub-call decodes to None."""
+        w3 = make_w3(feed_and_token())
+        token = proof_of_reserve.get_contract(w3, TOKEN, "token")
+
+        results = proof_of_reserve.multicall(w3, [(token, "totalSupply"), (token, "latestRoundData")], allow_failure=True)
+
+        assert results == [140_000 * 10**8, None]
+
+    @pytest.mark.unit
+    def test_revert_raises_without_allow_failure(self):
+        """A reverting sub-call raises like the equivalent .call() would."""
+        w3 = make_w3(feed_and_token())
+        token = proof_of_reserve.get_contract(w3, TOKEN, "token")
+
+        with pytest.raises(ValueError, match="reverted"):
+            proof_of_reserve.multicall(w3, [(token, "totalSupply"), (token, "latestRoundData")])
+
+
+class TestReserveRatioBatch:
+    """Tests for the vectorized reserve ratio calculation."""
+
+    @pytest.mark.unit
+    @pytest.mark.scoring
+    def test_batch_matches_scalar(self):
+        """Every field matches calculate_reserve_ratio asset by asset."""
+        from proof_of_reserve import calculate_reserve_ratio, calculate_reserve_ratios_batch
+
+        reserves = [100.0, 110.0, 80.0, 99.5, 0.0, 50.0]
+        supplies = [100.0, 100.0, 100.0, 100.0, 100.0, 0.0]
+
+        batch = calculate_reserve_ratios_batch(reserves, supplies)
+
+        for i, (r, s) in enumerate(zip(reserves, supplies)):
+            scalar = calculate_reserve_ratio(r, s)
+            for key, value in scalar.items():
+                assert batch[key][i] == pytest.approx(value), (key, r, s)
+
+    @pytest.mark.unit
+    @pytest.mark.scoring
+    def test_batch_zero_supply(self):
+        """Zero supply yields a zero ratio instead of a division error."""
+        from proof_of_reserve import calculate_reserve_ratios_batch
+
+        batch = calculate_reserve_ratios_batch([10.0], [0.0])
+
+        assert batch["reserve_ratio"][0] == 0.0
+        assert batch["score"][0] == 0.0
+        assert bool(batch["is_fully_backed"][0]) is True
+
+
+class TestDecimalsCache:
+    """Tests for the persisted (chain id, address) -> decimals cache."""
+
+    @pytest.mark.unit
+    def test_decimals_learned_once_per_chain_id(self, decimals_cache):
+        """The second read skips decimals() and the file is keyed by chain id."""
+        w3 = make_w3(feed_and_token(), chain_id=1)
+
+        first = proof_of_reserve.get_reserves_and_supply(w3, "ethereum", POR_FEED, TOKEN)
+        second = proof_of_reserve.get_reserves_and_supply(w3, "ethereum", POR_FEED, TOKEN)
+
+        assert first == second == (150_000.0, 140_000.0, 1000)
+        assert len(w3.eth_calls[0]) == 6
+        assert len(w3.eth_calls[1]) == 4
+        saved = json.loads((decimals_cache / "por_decimals.json").read_text())
+        assert saved == {f"1:{POR_FEED.lower()}": 8, f"1:{TOKEN.lower()}": 8}
+
+    @pytest.mark.unit
+    def test_invalid_saved_decimals_are_ignored(self, decimals_cache):
+        """Out-of-range or malformed entries in the cache file are not trusted."""
+        (decimals_cache / "por_decimals.json").write_text(json.dumps({
+            f"1:{POR_FEED}": 99, f"1:{TOKEN}": True, f"ethereum:{TOKEN}": 8
+        }))
+        w3 = make_w3(feed_and_token(), chain_id=1)
+
+        assert proof_of_reserve.get_reserves_and_supply(w3, "ethereum", POR_FEED, TOKEN)[:2] == (150_000.0, 140_000.0)
+        assert len(w3.eth_calls[0]) == 6
+
+    @pytest.mark.unit
+    def test_out_of_range_decimals_from_rpc_raise(self, decimals_cache):
+        """A decimals() answer above MAX_DECIMALS is rejected, not cached."""
+        w3 = make_w3(feed_and_token(token_decimals=40), chain_id=1)
+
+        with pytest.raises(ValueError):
+            proof_of_reserve.get_reserves_and_supply(w3, "ethereum", POR_FEED, TOKEN)
+        assert not (decimals_cache / "por_decimals.json").exists()
+
+    @pytest.mark.unit
+    def test_chain_name_mismatch_uses_rpc_chain_id(self, decimals_cache):
+        """Decimals cached for the named chain are not used when the RPC serves another one."""
+        proof_of_reserve._save_decimals({(8453, POR_FEED.lower()): 18, (8453, TOKEN.lower()): 18})
+        w3 = make_w3(feed_and_token(), chain_id=1)
+
+        reserves, supply, _ = proof_of_reserve.get_reserves_and_supply(w3, "base", POR_FEED, TOKEN)
+
+        assert (reserves, supply) == (150_000.0, 140_000.0)
+        assert len(w3.eth_calls) == 2
+
+    @pytest.mark.unit
+    def test_single_reads_use_cached_decimals(self, decimals_cache):
+        """get_reserves / get_evm_supply only request decimals() on first sight."""
+        w3 = make_w3(feed_and_token(), chain_id=1)
+
+        assert proof_of_reserve.get_reserves(w3, POR_FEED) == 150_000.0
+        assert proof_of_reserve.get_reserves(w3, POR_FEED) == 150_000.0
+        assert proof_of_reserve.get_evm_supply(w3, TOKEN) == 140_000.0
+        assert proof_of_reserve.get_evm_supply(w3, TOKEN) == 140_000.0
+
+        assert [len(calls) for calls in w3.eth_calls] == [4, 3, 4, 3]
+
+
+class TestCallFirstRpc:
+    """Tests for hedged reads across a chain's RPC URLs."""
+
+    @staticmethod
+    def read(delays, calls):
+        """fn for call_first_rpc: record the URL, sleep its delay, fail on None."""
+        def fn(w3):
+            url = w3.provider.endpoint_uri
+            calls.append(url)
+            if delays[url] is None:
+                raise ConnectionError(url)
+            time.sleep(delays[url])
+            return url
+        return fn
+
+    @pytest.mark.unit
+    def test_fast_primary_is_not_hedged(self):
+        """A primary answering within RPC_HEDGE_DELAY is the only request sent."""
+        calls = []
+        delays = {"http://primary": 0, "http://fallback": 0}
+        rpc_urls = {"ethereum": list(delays)}
+
+        result = proof_of_reserve.call_first_rpc("ethereum", rpc_urls, self.read(delays, calls))
+
+        assert result == "http://primary"
+        assert calls == ["http://primary"]
+
+    @pytest.mark.unit
+    def test_slow_primary_is_hedged(self, monkeypatch):
+        """A slow primary gets the fallback started after the hedge delay."""
+        monkeypatch.setattr(proof_of_reserve, "RPC_HEDGE_DELAY", 0.01)
+        calls = []
+        delays = {"http://primary": 0.5, "http://fallback": 0}
+        rpc_urls = {"ethereum": list(delays)}
+
+        result = proof_of_reserve.call_first_rpc("ethereum", rpc_urls, self.read(delays, calls))
+
+        assert result == "http://fallback"
+        assert calls == ["http://primary", "http://fallback"]
+
+    @pytest.mark.unit
+    def test_all_failing_raises_last_error(self):
+        """The last error is raised when every endpoint fails."""
+        calls = []
+        delays = {"http://primary": None, "http://fallback": None}
+        rpc_urls = {"ethereum": list(delays)}
+
+        with pytest.raises(ConnectionError, match="fallback"):
+            proof_of_reserve.call_first_rpc("ethereum", rpc_urls, self.read(delays, calls))
@@ -0,0 +1,70 @@
+"""
+Unit tests for risk_framework module.
+
+Tests run_per_chain, which runs per-chain analyses concurrently while
+keeping their output in task order. The analyses are plain callables, so
+no RPC or API access is needed.
+"""
+
+import threading
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+import risk_framework
+
+
+@pytest.fixture
+def printed(monkeypatch):
+    """Lines printed by run_per_chain, in order."""
+    lines = []
+    monkeypatch.setattr(risk_framework, "print", lambda *args, **kwargs: lines.append(" ".join(args)), raising=False)
+    return lines
+
+
+class TestRunPerChain:
+    """Tests for run_per_chain."""
+
+    @pytest.mark.unit
+    def test_first_chain_streams_later_chains_wait(self, printed):
+        """The first chain prints live; a faster later chain is held until it finishes."""
+        second_done = threading.Event()
+        seen_while_running = []
+
+        def first(emit):
+            emit("first: start")
+            assert second_done.wait(5)
+            seen_while_running.extend(printed)
+            emit("first: end")
+            return {"chain": "first"}
+
+        def second(emit):
+            emit("second: report")
+            second_done.set()
+            return {"chain": "second"}
+
+        results = risk_framework.run_per_chain([("first", first), ("second", second)])
+
+        assert results == [{"chain": "first"}, {"chain": "second"}]
+        assert seen_while_running == ["first: start"]
+        assert printed == ["first: start", "first: end", "second: report"]
+
+    @pytest.mark.unit
+    def test_errors_and_empty_results(self, printed):
+        """A raising chain is reported as an error; empty results are dropped."""
+        def failing(emit):
+            emit("failing: start")
+            raise RuntimeError("rpc down")
+
+        results = risk_framework.run_per_chain([
+            ("a", failing),
+            ("b", lambda emit: None),
+            ("c", lambda emit: {"chain": "c"}),
+        ])
+
+        assert results == [{"chain": "a", "error": "rpc down"}, {"chain": "c"}]
+        assert printed == ["failing: start"]
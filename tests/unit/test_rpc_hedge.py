@@ -0,0 +1,64 @@
+"""
+Unit tests for rpc_hedge module.
+
+Tests the primary-first hedging of reads across endpoints with plain
+Python callables, so no RPC is needed.
+"""
+
+import time
+
+import pytest
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from rpc_hedge import hedged_call
+
+
+def make_read(outcomes, calls):
+    """fn for hedged_call: record the candidate, then sleep / raise / return per outcomes."""
+    def fn(candidate):
+        calls.append(candidate)
+        delay, result = outcomes[candidate]
+        time.sleep(delay)
+        if isinstance(result, Exception):
+            raise result
+        return result
+    return fn
+
+
+class TestHedgedCall:
+    """Tests for hedged_call."""
+
+    @pytest.mark.unit
+    def test_fast_primary_is_not_hedged(self):
+        calls = []
+        outcomes = {"a": (0, "A"), "b": (0, "B")}
+        assert hedged_call(make_read(outcomes, calls), ["a", "b"], delay=1) == "A"
+        assert calls == ["a"]
+
+    @pytest.mark.unit
+    def test_slow_primary_is_hedged(self):
+        calls = []
+        outcomes = {"a": (0.5, "A"), "b": (0, "B")}
+        assert hedged_call(make_read(outcomes, calls), ["a", "b"], delay=0.01) == "B"
+        assert calls == ["a", "b"]
+
+    @pytest.mark.unit
+    def test_failure_hedges_without_waiting(self):
+        calls = []
+        outcomes = {"a": (0, None), "b": (0, "B")}
+        start = time.monotonic()
+        assert hedged_call(make_read(outcomes, calls), ["a", "b"], delay=5) == "B"
+        assert time.monotonic() - start < 1
+
+    @pytest.mark.unit
+    def test_all_failing(self):
+        outcomes = {"a": (0, ValueError("a")), "b": (0, ValueError("b"))}
+        with pytest.raises(ValueError, match="b"):
+            hedged_call(make_read(outcomes, []), ["a", "b"], delay=0.01)
+
+        outcomes = {"a": (0, None), "b": (0, None)}
+        assert hedged_call(make_read(outcomes, []), ["a", "b"], delay=0.01) is None
@@ -25,14 +25,14 @@ def gini(amounts):
     return (2 * np.sum(index * sorted_amounts)) / (n * np.sum(sorted_amounts)) - (n + 1) / n
 
 
-def get_ankr_holders(token_address, chain_name, max_holders=200, decimals=18):
+def get_ankr_holders(token_address, chain_name, max_holders=200, decimals=18, emit=print):
     """Get token holders using Ankr API"""
     holders = []
     page_token = None
     ankr_chain = ANKR_CHAINS.get(chain_name.lower())
 
     if not ankr_chain:
-        print(f"  Ankr does not support chain: {chain_name}")
+        emit(f"  Ankr does not support chain: {chain_name}")
         return []
 
     while len(holders) < max_holders:
@@ -56,7 +56,7 @@ def get_ankr_holders(token_address, chain_name, max_holders=200, decimals=18):
             data = response.json()
 
             if "error" in data:
-                print(f"  Ankr error: {data['error'].get('message', 'Unknown error')}")
+                emit(f"  Ankr error: {data['error'].get('message', 'Unknown error')}")
                 break
 
             result = data.get("result", {})
@@ -71,7 +71,7 @@ def get_ankr_holders(token_address, chain_name, max_holders=200, decimals=18):
                 holders.append((address, balance))
 
             page_token = result.get("nextPageToken")
-            print(f"  Fetched {len(holders)} holders via Ankr...", end="\r")
+            emit(f"  Fetched {len(holders)} holders via Ankr...", end="\r")
 
             if not page_token or len(holders) >= max_holders:
                 break
@@ -79,14 +79,14 @@ def get_ankr_holders(token_address, chain_name, max_holders=200, decimals=18):
             time.sleep(0.3)
 
         except Exception as e:
-            print(f"  Ankr error: {e}")
+            emit(f"  Ankr error: {e}")
             break
 
-    print(f"  Total holders fetched via Ankr: {len(holders)}")
+    emit(f"  Total holders fetched via Ankr: {len(holders)}")
     return holders[:max_holders]
 
 
-def get_evm_holders(token_address, blockscout_url, max_holders=200, decimals=8):
+def get_evm_holders(token_address, blockscout_url, max_holders=200, decimals=8, emit=print):
     holders = []
     url = f"{blockscout_url}/api/v2/tokens/{token_address}/holders"
     divisor = 10 ** decimals
@@ -107,15 +107,15 @@ def get_evm_holders(token_address, blockscout_url, max_holders=200, decimals=8):
             time.sleep(0.5)  # Small delay between requests
             
         except requests.exceptions.Timeout:
-            print(f"Timeout - try using Basescan API instead for Base")
+            emit(f"Timeout - try using Basescan API instead for Base")
             break
         except Exception as e:
-            print(f"Error: {e}")
+            emit(f"Error: {e}")
             break
     
     return holders[:max_holders]
 
-def get_solana_holders(token_address, max_holders=200):
+def get_solana_holders(token_address, max_holders=200, emit=print):
     holders = []
     cursor = None
     helius_key = "5167631c-772f-49bb-ab19-fe8553e4e6dc"
@@ -154,12 +154,13 @@ def get_solana_holders(token_address, max_holders=200):
             time.sleep(0.5)
             
         except Exception as e:
-            print(f"Error: {e}")
+            emit(f"Error: {e}")
             break
     
     return holders[:max_holders]
 
-def analyze_token(token_address, chain_name, blockscout_url=None, use_ankr=False, decimals=8) -> dict:
+def analyze_token(token_address, chain_name, blockscout_url=None, use_ankr=False, decimals=8,
+                  emit=print) -> dict:
     """
     Analyze token distribution. Returns dict with metrics.
 
@@ -169,8 +170,9 @@ def analyze_token(token_address, chain_name, blockscout_url=None, use_ankr=False
         blockscout_url: Blockscout API URL (optional for EVM chains)
         use_ankr: Force using Ankr API instead of Blockscout
         decimals: Token decimals (default 8 for cbBTC-like tokens)
+        emit: Callable used instead of print for progress and the report
     """
-    print(f"\nAnalyzing {chain_name}...", flush=True)
+    emit(f"\nAnalyzing {chain_name}...", flush=True)
 
     result = {
         "chain": chain_name,
@@ -184,26 +186,26 @@ def analyze_token(token_address, chain_name, blockscout_url=None, use_ankr=False
 
     # Determine which API to use
     if chain_name.lower() == "solana":
-        holders = get_solana_holders(token_address)
+        holders = get_solana_holders(token_address, emit=emit)
         result["data_source"] = "Helius"
     elif use_ankr or chain_name.lower() in ["arbitrum", "ethereum"]:
         # Use Ankr for Arbitrum/Ethereum (Blockscout often unreliable) or if explicitly requested
-        print(f"  Using Ankr API...")
-        holders = get_ankr_holders(token_address, chain_name, decimals=decimals)
+        emit(f"  Using Ankr API...")
+        holders = get_ankr_holders(token_address, chain_name, decimals=decimals, emit=emit)
         result["data_source"] = "Ankr"
     elif blockscout_url:
         # Try Blockscout first
-        holders = get_evm_holders(token_address, blockscout_url, decimals=decimals)
+        holders = get_evm_holders(token_address, blockscout_url, decimals=decimals, emit=emit)
         result["data_source"] = "Blockscout"
 
         # Fallback to Ankr if Blockscout fails
         if not holders and chain_name.lower() in ANKR_CHAINS:
-            print(f"  Blockscout failed, trying Ankr as fallback...")
-            holders = get_ankr_holders(token_address, chain_name, decimals=decimals)
+            emit(f"  Blockscout failed, trying Ankr as fallback...")
+            holders = get_ankr_holders(token_address, chain_name, decimals=decimals, emit=emit)
             result["data_source"] = "Ankr (fallback)"
 
     if not holders:
-        print(f"No data for {chain_name}\n")
+        emit(f"No data for {chain_name}\n")
         result["error"] = "No holder data"
         return result
 
@@ -228,14 +230,14 @@ def analyze_token(token_address, chain_name, blockscout_url=None, use_ankr=False
         for addr, bal in holders[:10]
     ]
 
-    print(f"\n{'='*60}")
-    print(f"{chain_name} - Token Distribution")
-    print(f"{'='*60}")
-    print(f"Holders Analyzed: {len(holders)}")
-    print(f"Gini Coefficient: {gini_coeff:.4f}")
-    print(f"Top 10 Concentration: {top_10_concentration:.2f}%")
-    print(f"Top 50 Concentration: {top_50_concentration:.2f}%")
-    print(f"{'='*60}\n")
+    emit(f"\n{'='*60}")
+    emit(f"{chain_name} - Token Distribution")
+    emit(f"{'='*60}")
+    emit(f"Holders Analyzed: {len(holders)}")
+    emit(f"Gini Coefficient: {gini_coeff:.4f}")
+    emit(f"Top 10 Concentration: {top_10_concentration:.2f}%")
+    emit(f"Top 50 Concentration: {top_50_concentration:.2f}%")
+    emit(f"{'='*60}\n")
 
     result["status"] = "success"
     return result
@@ -6,9 +6,10 @@ Supports both Uniswap official schema and Messari schema
 """
 
 import requests
-from collections import defaultdict
 from typing import Dict, List, Optional
 
+from lp_metrics import concentration_metrics, position_columns
+
 # Default subgraph IDs (Uniswap official schema)
 DEFAULT_SUBGRAPH_IDS = {
     "ethereum": "5zvR82QoaXYFyDEKLZ9t6v9adgnptxYpKpSbxtgVENFV",
@@ -212,47 +213,7 @@ class UniswapV3Analyzer:
 
     def calculate_metrics(self, positions: List[dict], pool_data: dict) -> dict:
         """Calculate HHI, concentration, and holder metrics."""
-        # Aggregate liquidity by owner
-        owner_liquidity = defaultdict(float)
-        for pos in positions:
-            owner = pos["owner"]
-            liquidity = float(pos["liquidity"])
-            owner_liquidity[owner] += liquidity
-
-        # Calculate total liquidity and unique holders
-        total_liquidity = sum(owner_liquidity.values())
-        unique_holders = len(owner_liquidity)
-
-        # Sort owners by liquidity (descending)
-        sorted_owners = sorted(
-            owner_liquidity.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-
-        # Calculate market shares and HHI
-        market_shares = []
-        hhi = 0.0
-
-        for owner, liquidity in sorted_owners:
-            share_pct = (liquidity / total_liquidity) * 100 if total_liquidity > 0 else 0
-            market_shares.append((owner, liquidity, share_pct))
-            hhi += share_pct ** 2
-
-        # Top concentrations
-        def get_top_concentration(n: int) -> float:
-            return sum(share for _, _, share in market_shares[:n])
-
-        return {
-            "unique_holders": unique_holders,
-            "total_liquidity": total_liquidity,
-            "hhi": hhi,
-            "top_1": get_top_concentration(1),
-            "top_3": get_top_concentration(3),
-            "top_5": get_top_concentration(5),
-            "top_10": get_top_concentration(10),
-            "top_lps": market_shares[:10],
-        }
+        return concentration_metrics(*position_columns(positions))
 
     def analyze_pool(self, pool_address: str) -> dict:
         """Complete pool analysis with formatted output. Returns dict with all metrics."""